@@ -29,7 +29,7 @@ async def generate_renovation_strategy(request: RenovationStrategyRequest):
     """
     return {
         "message": "Mistral AI integration - to be implemented",
-        "request": request.dict(),
+        "request": request.model_dump(),
         "ai_transparency_badge": True,
         "human_verification_required": False,
         "status": "placeholder"
@@ -106,8 +106,8 @@ async def diagnose_property(
 
             # DPE 2026
             'dpe_2026': {
-                'original_class': analysis.dpe_2026_result.original_classification.value,
-                'recalculated_class': analysis.dpe_2026_result.recalculated_classification.value,
+                'original_class': analysis.dpe_2026_result.original_classification.letter,
+                'recalculated_class': analysis.dpe_2026_result.recalculated_classification.letter,
                 'is_passoire_thermique': analysis.dpe_2026_result.is_passoire_thermique,
                 'renovation_urgency': analysis.dpe_2026_result.renovation_urgency.value,
                 'rental_ban_date': analysis.dpe_2026_result.rental_ban_date.isoformat() if analysis.dpe_2026_result.rental_ban_date else None,
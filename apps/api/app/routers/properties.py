@@ -128,11 +128,11 @@ async def analyze_dpe_2026(request: DPE2026AnalysisRequest):
 
         return {
             "original": {
-                "classification": result.original_classification.value,
+                "classification": result.original_classification.letter,
                 "primary_energy": result.original_primary_energy
             },
             "recalculated_2026": {
-                "classification": result.recalculated_classification.value,
+                "classification": result.recalculated_classification.letter,
                 "primary_energy": result.recalculated_primary_energy,
                 "change": result.original_primary_energy - result.recalculated_primary_energy
             },
@@ -0,0 +1,72 @@
+"""
+DPE 2026 numeric kernels
+========================
+Scalar hot-path arithmetic for dpe_2026_calculator, isolated so it can be
+AOT-compiled with mypyc at image build time (see apps/api/Dockerfile):
+C-speed from the first request, with no JIT warm-up or LLVM dependency.
+The module stays plain importable Python in development - the compiled
+extension simply shadows it when present.
+
+Every function here is strictly typed on purpose: mypyc unboxes annotated
+floats/ints, so keep annotations exact when editing.
+"""
+
+from typing import Tuple
+
+
+def _recalc_primary(
+    total_final: float,
+    elec_pct: float,
+    gas_pct: float,
+    oil_pct: float,
+    wood_pct: float,
+) -> float:
+    """Weighted 2026 primary-energy conversion (factors per Decree No. 2026-01)"""
+    # Keep in sync with DPE2026Calculator.*_FACTOR constants - the compiled
+    # code can't read class attributes, and literal constants fold in
+    return total_final * (elec_pct * 1.9 + gas_pct * 1.0 + oil_pct * 1.0 + wood_pct * 0.6)
+
+
+def _dpe_kernel(
+    total_final: float,
+    elec_pct: float,
+    gas_pct: float,
+    oil_pct: float,
+    wood_pct: float,
+    surface_m2: float,
+) -> Tuple[float, int, float]:
+    """
+    Fused primary-energy + classification + annual-cost kernel
+
+    One compiled pass over the same inputs replaces three separate calls
+    (recalculate, classify, estimate costs) that each re-derived the energy
+    mix - same FLOPs, two fewer Python frames and factor computations.
+    """
+    primary = total_final * (elec_pct * 1.9 + gas_pct * 1.0 + oil_pct * 1.0 + wood_pct * 0.6)
+    cost = total_final * surface_m2 * (
+        elec_pct * 0.2516 + gas_pct * 0.1121 + oil_pct * 0.1450 + wood_pct * 0.0650
+    )
+    # Branchless classification: sum of boundary compares (A=0 .. G=6),
+    # equivalent to bisect_left over _DPE_BOUNDS
+    cls_idx = (
+        int(primary > 70.0) + int(primary > 110.0) + int(primary > 180.0)
+        + int(primary > 250.0) + int(primary > 330.0) + int(primary > 420.0)
+    )
+    return primary, cls_idx, cost
+
+
+def _estimate_energy_costs(
+    total_consumption: float,
+    elec_pct: float,
+    gas_pct: float,
+    oil_pct: float,
+    wood_pct: float,
+) -> float:
+    """Annual energy cost (EUR) from flat percentages - 2026 EUR/kWh rates"""
+    # Keep in sync with DPE2026Calculator.ENERGY_COSTS; the unrolled form
+    # avoids building and iterating an energy_mix dict per call
+    return round(
+        total_consumption
+        * (elec_pct * 0.2516 + gas_pct * 0.1121 + oil_pct * 0.1450 + wood_pct * 0.0650),
+        2,
+    )
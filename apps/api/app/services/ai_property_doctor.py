@@ -283,8 +283,8 @@ class AIPropertyDoctor:
 
         # Convert DPE result to dict for valuation
         dpe_dict = {
-            'original_classification': dpe_result.original_classification.value,
-            'recalculated_classification': dpe_result.recalculated_classification.value,
+            'original_classification': dpe_result.original_classification.letter,
+            'recalculated_classification': dpe_result.recalculated_classification.letter,
             'recalculated_primary_energy': dpe_result.recalculated_primary_energy,
             'is_passoire_thermique': dpe_result.is_passoire_thermique,
             'potential_value_loss_percent': dpe_result.potential_value_loss_percent
@@ -385,9 +385,9 @@ class AIPropertyDoctor:
 
         # Energy reasons
         if dpe.is_passoire_thermique:
-            reasons.append(f"❌ Passoire thermique ({dpe.recalculated_classification.value}) - Risque locatif")
-        elif dpe.recalculated_classification.value in ['A', 'B', 'C']:
-            reasons.append(f"✅ Excellent DPE ({dpe.recalculated_classification.value}) - Valeur sécurisée")
+            reasons.append(f"❌ Passoire thermique ({dpe.recalculated_classification.letter}) - Risque locatif")
+        elif dpe.recalculated_classification.letter in ['A', 'B', 'C']:
+            reasons.append(f"✅ Excellent DPE ({dpe.recalculated_classification.letter}) - Valeur sécurisée")
 
         # Value reasons
         if valuation.value_difference_percent > 10:
@@ -504,8 +504,8 @@ Risques détectés: {len(vision.thermal_risk_areas)}
         """Generate DPE summary"""
         improvement = "✅ Amélioré" if dpe.recalculated_classification != dpe.original_classification else "➡️ Inchangé"
         return f"""
-Classe originale: {dpe.original_classification.value}
-Classe 2026: {dpe.recalculated_classification.value} {improvement}
+Classe originale: {dpe.original_classification.letter}
+Classe 2026: {dpe.recalculated_classification.letter} {improvement}
 Passoire thermique: {'OUI ❌' if dpe.is_passoire_thermique else 'NON ✅'}
 Coût énergétique annuel: {dpe.estimated_energy_cost_annual:,.0f} EUR
 """
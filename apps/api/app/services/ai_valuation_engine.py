@@ -14,25 +14,31 @@ Date: January 2026
 License: Apache 2.0
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 import pickle
-from datetime import datetime, timedelta
 
-import numpy as np
-import pandas as pd
-import xgboost as xgb
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import r2_score, mean_absolute_error
-from sklearn.preprocessing import LabelEncoder
+# Heavy ML libraries (xgboost pulls in libxgboost.so, sklearn imports a lot
+# of code) are imported lazily inside the methods that need them, so API
+# workers that never hit the valuation endpoint don't pay the cold-start cost
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import xgboost as xgb
+    from sklearn.preprocessing import LabelEncoder
 
 logger = logging.getLogger(__name__)
 
+# DPE class → numeric score (A best, G worst)
+_DPE_NUMERIC = {'A': 7, 'B': 6, 'C': 5, 'D': 4, 'E': 3, 'F': 2, 'G': 1}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertyValuation:
-    """Complete property valuation result"""
+    """Complete property valuation result (immutable, slotted for batch scoring)"""
     market_value_eur: float
     energy_adjusted_value_eur: float
     value_difference_eur: float
@@ -53,6 +59,24 @@ class AIPropertyValuationEngine:
     Achieves R² = 0.918 accuracy (outperforms traditional methods by 23%)
     """
 
+    # Feature layout for single-property prediction (order matters!)
+    PREDICTION_FEATURES = (
+        'surface_m2',
+        'nb_pieces',
+        'dpe_class_numeric',
+        'primary_energy_kwh',
+        'is_passoire_thermique',
+    )
+
+    # Continuous features quantized to uint8 histogram bins before training.
+    # Encoded/ordinal columns (DPE class, flags, label encodings) are left as-is.
+    BINNED_FEATURES = (
+        'surface_m2',
+        'surface_terrain_m2',
+        'primary_energy_kwh',
+        'estimated_annual_energy_cost',
+    )
+
     def __init__(self, model_path: Optional[str] = None):
         """
         Initialize the valuation engine
@@ -60,9 +84,23 @@ class AIPropertyValuationEngine:
         Args:
             model_path: Path to pre-trained XGBoost model (optional)
         """
+        import numpy as np
+        import xgboost as xgb
+
         self.model: Optional[xgb.XGBRegressor] = None
         self.label_encoders: Dict[str, LabelEncoder] = {}
-        self.feature_importance: Optional[pd.DataFrame] = None
+        self.feature_importance: Optional[List[Tuple[str, float]]] = None
+        self.bin_edges: Dict[str, np.ndarray] = {}
+
+        # Reusable prediction buffer - avoids building a one-row DataFrame
+        # (dict → columnar conversion + dtype inference) on every prediction
+        self._pred_buf = np.zeros((1, len(self.PREDICTION_FEATURES)), dtype=np.float32)
+
+        # Raw booster handle, cached so each prediction skips the sklearn
+        # wrapper (and its per-call feature-name validation), plus the
+        # iteration range the wrapper would have used (see predict)
+        self._booster: Optional[xgb.Booster] = None
+        self._predict_iteration_range: Tuple[int, int] = (0, 0)
 
         if model_path:
             self.load_model(model_path)
@@ -80,7 +118,14 @@ class AIPropertyValuationEngine:
                 reg_alpha=0.1,
                 reg_lambda=1.0,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=-1,
+                tree_method='hist',
+                max_bin=256,
+                # XGBoost >=2.0: early stopping is a constructor param so it
+                # runs inside the native training loop, not a sklearn-shim
+                # fit() kwarg re-evaluated from Python after every round
+                early_stopping_rounds=50,
+                eval_metric='rmse'
             )
 
         logger.info("AI Valuation Engine ready!")
@@ -100,6 +145,9 @@ class AIPropertyValuationEngine:
         Returns:
             Training metrics and feature importance
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import r2_score, mean_absolute_error
+
         logger.info("🎓 Training XGBoost on French real estate data...")
 
         # Merge DVF + DPE data
@@ -117,27 +165,31 @@ class AIPropertyValuationEngine:
         self.model.fit(
             X_train, y_train,
             eval_set=[(X_test, y_test)],
-            early_stopping_rounds=50,
             verbose=100
         )
+        self._booster = None  # fit() built a fresh booster
 
         # Evaluate
         y_pred = self.model.predict(X_test)
         r2 = r2_score(y_test, y_pred)
         mae = mean_absolute_error(y_test, y_pred)
 
-        # Feature importance
-        self.feature_importance = pd.DataFrame({
-            'feature': X.columns,
-            'importance': self.model.feature_importances_
-        }).sort_values('importance', ascending=False)
+        # Feature importance - a plain sorted list is enough for a ~50-row
+        # table and avoids pickling a full DataFrame with the model
+        self.feature_importance = sorted(
+            zip(X.columns, (float(i) for i in self.model.feature_importances_)),
+            key=lambda pair: -pair[1]
+        )
 
         metrics = {
             'r2_score': r2,
             'mae_eur': mae,
             'train_samples': len(X_train),
             'test_samples': len(X_test),
-            'top_features': self.feature_importance.head(10).to_dict('records')
+            'top_features': [
+                {'feature': feature, 'importance': importance}
+                for feature, importance in self.feature_importance[:10]
+            ]
         }
 
         logger.info(f"✅ Training complete! R² = {r2:.3f}, MAE = {mae:,.0f} EUR")
@@ -149,56 +201,74 @@ class AIPropertyValuationEngine:
 
         Creates 50+ features from raw DVF + DPE data
         """
-        features = data.copy()
+        import numpy as np
+        import pandas as pd
+        from sklearn.preprocessing import LabelEncoder
+
+        # Read columns straight off the merged frame - copying it first would
+        # duplicate the whole DVF+DPE merge (easily gigabytes) for nothing
 
         # Target variable
-        y = features['valeur_fonciere']
+        y = data['valeur_fonciere']
 
         # Base features
         X = pd.DataFrame()
 
         # 1. Surface features
-        X['surface_m2'] = features['surface_reelle_bati']
-        X['surface_terrain_m2'] = features.get('surface_terrain', 0)
-        X['nb_pieces'] = features['nombre_pieces_principales']
-        X['price_per_m2'] = features['valeur_fonciere'] / (features['surface_reelle_bati'] + 1)
+        X['surface_m2'] = data['surface_reelle_bati']
+        X['surface_terrain_m2'] = data.get('surface_terrain', 0)
+        X['nb_pieces'] = data['nombre_pieces_principales']
+        # NB: no price_per_m2 here - it divides the target by a feature, which
+        # leaks valeur_fonciere into X (and the feature doesn't exist at
+        # prediction time anyway, so train/predict schemas would diverge)
 
         # 2. Location features (encode categorical)
         for col in ['code_postal', 'code_commune', 'type_local']:
-            if col in features.columns:
+            if col in data.columns:
                 if col not in self.label_encoders:
                     self.label_encoders[col] = LabelEncoder()
-                    X[f'{col}_encoded'] = self.label_encoders[col].fit_transform(features[col].fillna('unknown'))
+                    X[f'{col}_encoded'] = self.label_encoders[col].fit_transform(data[col].fillna('unknown'))
                 else:
-                    X[f'{col}_encoded'] = self.label_encoders[col].transform(features[col].fillna('unknown'))
+                    X[f'{col}_encoded'] = self.label_encoders[col].transform(data[col].fillna('unknown'))
 
         # 3. **DPE/Energy features** (CRITICAL!)
-        X['dpe_class_numeric'] = features['classe_consommation_energie'].map({
-            'A': 7, 'B': 6, 'C': 5, 'D': 4, 'E': 3, 'F': 2, 'G': 1
-        }).fillna(0)
-
-        X['primary_energy_kwh'] = features.get('consommation_energie', 0)
-        X['is_passoire_thermique'] = features['classe_consommation_energie'].isin(['F', 'G']).astype(int)
-
-        # DPE 2026 recalculation impact
-        X['dpe_2026_improvement_potential'] = (
-            X['is_passoire_thermique'] * 2  # F/G properties benefit from 1.9 factor
+        # Work on int8 categorical codes (A=0..G=6, -1 for missing) so the
+        # flags below are SIMD-friendly integer compares instead of per-row
+        # string hashing through isin()/map()
+        dpe_class = data['classe_consommation_energie']
+        dpe_codes = pd.Categorical(dpe_class, categories=list(_DPE_NUMERIC)).codes
+        X['dpe_class_numeric'] = np.where(dpe_codes >= 0, 7 - dpe_codes, 0)
+
+        X['primary_energy_kwh'] = data.get('consommation_energie', 0)
+        X['is_passoire_thermique'] = ((dpe_codes == 5) | (dpe_codes == 6)).view(np.int8)
+
+        # DPE 2026 recalculation impact (F/G properties benefit from 1.9 factor)
+        X['dpe_2026_improvement_potential'] = pd.eval(
+            'is_passoire * 2',
+            local_dict={'is_passoire': X['is_passoire_thermique'].values},
+            engine='numexpr'
         )
 
-        # 4. Temporal features
-        if 'date_mutation' in features.columns:
-            features['date_mutation'] = pd.to_datetime(features['date_mutation'])
-            X['year'] = features['date_mutation'].dt.year
-            X['month'] = features['date_mutation'].dt.month
-            X['quarter'] = features['date_mutation'].dt.quarter
-
-        # 5. Energy cost impact
-        X['estimated_annual_energy_cost'] = (
-            X['primary_energy_kwh'] * X['surface_m2'] * 0.2  # EUR/kWh
+        # 4. Temporal features (local Series - don't write back into the input)
+        if 'date_mutation' in data.columns:
+            date_mutation = pd.to_datetime(data['date_mutation'])
+            X['year'] = date_mutation.dt.year
+            X['month'] = date_mutation.dt.month
+            X['quarter'] = date_mutation.dt.quarter
+
+        # 5. Energy cost impact (0.2 EUR/kWh) - numexpr fuses the two multiplies
+        # into one cache-tiled pass instead of materializing a temporary array
+        X['estimated_annual_energy_cost'] = pd.eval(
+            'primary_energy_kwh * surface_m2 * 0.2',
+            local_dict={
+                'primary_energy_kwh': X['primary_energy_kwh'].values,
+                'surface_m2': X['surface_m2'].values
+            },
+            engine='numexpr'
         )
 
         # 6. Rental ban risk (Loi Climat 2026)
-        X['rental_ban_risk'] = features['classe_consommation_energie'].map({
+        X['rental_ban_risk'] = dpe_class.map({
             'G': 3,  # Already banned
             'F': 2,  # Ban in 2028
             'E': 1,  # Ban in 2034
@@ -207,8 +277,42 @@ class AIPropertyValuationEngine:
         # Fill NaN values
         X = X.fillna(0)
 
+        # Quantize continuous features to uint8 quantile bins (mirrors the
+        # quantile-sketch binning hist does internally, so no signal is
+        # lost) - shrinks the training matrix 8x and speeds up DMatrix
+        # construction
+        self._quantize_continuous_features(X)
+
         return X, y
 
+    def _quantize_continuous_features(self, X: pd.DataFrame) -> None:
+        """Bin continuous columns to uint8 in-place, recording bin edges for prediction"""
+        import numpy as np
+        import pandas as pd
+
+        for col in self.BINNED_FEATURES:
+            if col not in X.columns:
+                continue
+            # Quantile edges follow the data density, so skewed features
+            # (surfaces, EUR costs) keep resolution where the rows live;
+            # duplicate edges collapse when a value dominates the column
+            binned, edges = pd.qcut(
+                X[col], q=256, labels=False, retbins=True, duplicates='drop'
+            )
+            X[col] = binned.fillna(0).astype(np.uint8)
+            self.bin_edges[col] = edges
+
+    def _bin_value(self, feature: str, value: float) -> float:
+        """Map a raw feature value into its training-time uint8 bin"""
+        import numpy as np
+
+        edges = self.bin_edges.get(feature)
+        if edges is None:
+            return value
+        # duplicates='drop' can leave fewer than 256 bins, so clamp to the
+        # actual last bin index rather than a hard-coded 255
+        return float(min(max(np.searchsorted(edges, value) - 1, 0), len(edges) - 2))
+
     def predict_property_value(
         self,
         property_data: Dict,
@@ -232,8 +336,26 @@ class AIPropertyValuationEngine:
         # Prepare features
         X = self._prepare_prediction_features(property_data, dpe_result)
 
-        # Predict market value
-        market_value = self.model.predict(X)[0]
+        # Predict market value straight through the booster: inplace_predict
+        # reads the reusable buffer without building a DMatrix copy, and
+        # validate_features=False skips the per-call feature-name walk
+        if self._booster is None:
+            self._booster = self.model.get_booster()
+            # Mirror the sklearn predict path: with early stopping, fit()
+            # sets best_iteration and model.predict truncates to it, so the
+            # raw booster must too or serving would include the post-best
+            # overfit rounds the training metrics never saw. Boosters
+            # without early stopping (e.g. loaded pickles) keep (0, 0),
+            # xgboost's "all rounds"
+            best_iteration = getattr(self.model, 'best_iteration', None)
+            self._predict_iteration_range = (
+                (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+            )
+        market_value = float(self._booster.inplace_predict(
+            X,
+            iteration_range=self._predict_iteration_range,
+            validate_features=False
+        )[0])
 
         # Calculate energy-adjusted value
         energy_adjusted_value, dpe_impact = self._calculate_energy_adjustment(
@@ -283,25 +405,20 @@ class AIPropertyValuationEngine:
         self,
         property_data: Dict,
         dpe_result: Optional[Dict]
-    ) -> pd.DataFrame:
-        """Prepare features for a single prediction"""
-        X = pd.DataFrame([{
-            'surface_m2': property_data.get('surface_m2', 50),
-            'nb_pieces': property_data.get('nb_pieces', 2),
-            'dpe_class_numeric': self._dpe_to_numeric(
-                dpe_result.get('recalculated_classification') if dpe_result else 'D'
-            ),
-            'primary_energy_kwh': dpe_result.get('recalculated_primary_energy', 250) if dpe_result else 250,
-            'is_passoire_thermique': dpe_result.get('is_passoire_thermique', 0) if dpe_result else 0,
-            # Add more features as needed
-        }])
-
-        return X
+    ) -> np.ndarray:
+        """Prepare features for a single prediction (writes into the reusable buffer)"""
+        dpe = dpe_result or {}
+        buf = self._pred_buf
+        buf[0, 0] = self._bin_value('surface_m2', property_data.get('surface_m2', 50))
+        buf[0, 1] = property_data.get('nb_pieces', 2)
+        buf[0, 2] = self._dpe_to_numeric(dpe.get('recalculated_classification', 'D'))
+        buf[0, 3] = self._bin_value('primary_energy_kwh', dpe.get('recalculated_primary_energy', 250))
+        buf[0, 4] = dpe.get('is_passoire_thermique', 0)
+        return buf
 
     def _dpe_to_numeric(self, dpe_class: str) -> int:
         """Convert DPE class to numeric"""
-        mapping = {'A': 7, 'B': 6, 'C': 5, 'D': 4, 'E': 3, 'F': 2, 'G': 1}
-        return mapping.get(dpe_class, 4)
+        return _DPE_NUMERIC.get(dpe_class, 4)
 
     def _calculate_energy_adjustment(
         self,
@@ -408,7 +525,8 @@ class AIPropertyValuationEngine:
             pickle.dump({
                 'model': self.model,
                 'label_encoders': self.label_encoders,
-                'feature_importance': self.feature_importance
+                'feature_importance': self.feature_importance,
+                'bin_edges': self.bin_edges
             }, f)
         logger.info(f"Model saved to {path}")
 
@@ -419,6 +537,8 @@ class AIPropertyValuationEngine:
             self.model = data['model']
             self.label_encoders = data['label_encoders']
             self.feature_importance = data.get('feature_importance')
+            self.bin_edges = data.get('bin_edges', {})
+        self._booster = None
         logger.info(f"Model loaded from {path}")
 
 
@@ -14,25 +14,99 @@ Date: January 2026
 Regulatory Framework: Loi Climat et Résilience + EU AI Act
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
-from typing import Optional, Dict, List
+import bisect
 import logging
+import queue
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum, IntEnum
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, TYPE_CHECKING
+
+# numpy is imported lazily inside calculate_batch so scalar-only callers
+# skip the import cost; the annotation-only alias lives here
+if TYPE_CHECKING:
+    import numpy as np
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
-class DPEClassification(str, Enum):
-    """DPE Energy Performance Classifications (A-G scale)"""
-    A = "A"  # ≤ 70 kWh/m²/year (Excellent)
-    B = "B"  # 71-110 kWh/m²/year (Good)
-    C = "C"  # 111-180 kWh/m²/year (Average)
-    D = "D"  # 181-250 kWh/m²/year (Mediocre)
-    E = "E"  # 251-330 kWh/m²/year (Poor)
-    F = "F"  # 331-420 kWh/m²/year (Very Poor - Passoire Thermique)
-    G = "G"  # > 420 kWh/m²/year (Extremely Poor - Passoire Thermique)
+class _RootHandlerForwarder(logging.Handler):
+    """Replays queued records against whatever root handlers exist at drain time"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().callHandlers(record)
+
+
+# Route this module's records through an in-memory queue drained by a daemon
+# listener thread: a log call on the calculation hot path costs one enqueue
+# instead of handler dispatch, formatting and I/O under logging._lock. The
+# forwarder resolves root handlers per record, so logging configured after
+# import (basicConfig, uvicorn) still applies.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _RootHandlerForwarder(), respect_handler_level=True)
+_log_listener.start()
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+# The scalar arithmetic kernels live in _dpe_kernels, a strictly-typed module
+# AOT-compiled with mypyc at image build (see Dockerfile) - C-speed from the
+# first request, with no JIT warm-up or LLVM dependency
+from app.services._dpe_kernels import _dpe_kernel, _estimate_energy_costs, _recalc_primary
+
+
+class DPEClassification(IntEnum):
+    """
+    DPE Energy Performance Classifications (A-G scale)
+
+    Integer-valued (A=0 .. G=6) so hot-path comparisons and table indexing
+    are C-level int operations instead of enum __eq__/__hash__ dispatch.
+    Use .letter / from_letter() for the A-G string form at API boundaries.
+    """
+    A = 0  # ≤ 70 kWh/m²/year (Excellent)
+    B = 1  # 71-110 kWh/m²/year (Good)
+    C = 2  # 111-180 kWh/m²/year (Average)
+    D = 3  # 181-250 kWh/m²/year (Mediocre)
+    E = 4  # 251-330 kWh/m²/year (Poor)
+    F = 5  # 331-420 kWh/m²/year (Very Poor - Passoire Thermique)
+    G = 6  # > 420 kWh/m²/year (Extremely Poor - Passoire Thermique)
+
+    @property
+    def letter(self) -> str:
+        """The A-G letter used by ADEME and in API responses"""
+        return self.name
+
+    @classmethod
+    def from_letter(cls, letter: str) -> "DPEClassification":
+        """Parse an ADEME letter ('A'..'G') into a classification"""
+        return cls[letter]
+
+
+# Classification lookup tables: inclusive upper bounds (kWh EP/m²/year) and
+# the classes they map to, kept flat for C-level bisect on the hot path
+_DPE_BOUNDS = (70.0, 110.0, 180.0, 250.0, 330.0, 420.0)
+_DPE_CLASSES = (
+    DPEClassification.A,
+    DPEClassification.B,
+    DPEClassification.C,
+    DPEClassification.D,
+    DPEClassification.E,
+    DPEClassification.F,
+    DPEClassification.G,
+)
+
+# Flat per-class tables indexed by the classification's int value (A=0 .. G=6):
+# plain tuple indexing on the hot path instead of dict hashing per call
+_BAN_DATES = (
+    None, None, None, None,
+    datetime(2034, 1, 1),  # E
+    datetime(2028, 1, 1),  # F
+    datetime(2025, 1, 1),  # G - already banned
+)
+_DEPRECIATION = (0.0, 0.0, 0.0, 0.0, 6.5, 12.0, 16.0)
 
 
 class RenovationUrgency(str, Enum):
@@ -43,30 +117,135 @@ class RenovationUrgency(str, Enum):
     CRITICAL = "critical"  # G: Already banned since 2025
 
 
-@dataclass
+# Batch results are written into one contiguous structured array instead of
+# per-row Python objects (see calculate_batch / DPE2026Result.from_row).
+# The field list stays plain tuples so numpy remains a lazy import; the
+# np.dtype is materialized on first batch call.
+_RESULT_FIELDS = (
+    ('recalc_cls', 'u1'),      # 0=A .. 6=G
+    ('primary_e', 'f4'),       # kWh EP/m²/year
+    ('cost', 'f4'),            # EUR/year
+    ('depreciation', 'f4'),    # % value loss
+    ('surface', 'f4'),         # m², kept for renovation-cost rehydration
+    ('ban_year', 'i2'),        # 0 = no rental ban applies
+    ('urgency', 'u1'),         # index into _URGENCY_BY_INDEX
+    ('is_passoire', '?'),
+)
+_RESULT_DTYPE = None
+
+# Vectorized counterparts of _renovation_urgency / _BAN_DATES, indexed by
+# class id for rental properties (owner-occupied rows stay 0 / COMPLIANT)
+_URGENCY_BY_INDEX = (
+    RenovationUrgency.COMPLIANT,
+    RenovationUrgency.WARNING,
+    RenovationUrgency.URGENT,
+    RenovationUrgency.CRITICAL,
+)
+_RENTAL_URGENCY_IDS = (0, 0, 0, 0, 1, 2, 3)
+_BAN_YEARS = (0, 0, 0, 0, 2034, 2028, 2025)
+
+
+# Renovation cost ranges (EUR/m²) by class id - ANAH 2025 averages
+_RENOVATION_COST_PER_M2 = {4: (150, 250), 5: (300, 500), 6: (500, 800)}
+
+# Static entries of the AI Act compliance metadata - identical for every
+# result, so they live here instead of being rebuilt per calculation
+_METADATA_REGULATORY_FRAMEWORK = 'Loi Climat et Résilience 2026 + EU EPBD 2024'
+_METADATA_METHODOLOGY = 'DPE 3CL-2021 (updated Jan 2026)'
+_METADATA_DATA_SOURCES = ('ADEME DPE API', 'DVF Gouv')
+
+
+# The sub-calculations below are pure functions of a class id plus a small
+# hashable input, so near-duplicate properties in a portfolio hit the memo
+# instead of recomputing. They live at module level because lru_cache on
+# methods would keep `self` alive in the cache keys.
+
+@lru_cache(maxsize=32)
+def _renovation_urgency(cls_idx: int, is_rental: bool) -> "RenovationUrgency":
+    if not is_rental or cls_idx <= 3:
+        return RenovationUrgency.COMPLIANT
+    if cls_idx == 6:  # G
+        return RenovationUrgency.CRITICAL
+    if cls_idx == 5:  # F
+        return RenovationUrgency.URGENT
+    return RenovationUrgency.WARNING  # E
+
+
+@lru_cache(maxsize=32)
+def _value_depreciation(cls_idx: int, is_rental: bool) -> float:
+    depreciation = _DEPRECIATION[cls_idx]
+    if is_rental and cls_idx >= 5:
+        depreciation *= 1.25  # 25% additional depreciation facing the ban
+    return round(depreciation, 1)
+
+
+# Efficient A-D properties only get the renewable-energy suggestion - no
+# urgent renovation work to recommend, so skip the per-call list building
+_GREEN_PRIORITIES = ("Panneaux solaires photovoltaïques (autoconsommation)",)
+
+
+@lru_cache(maxsize=32)
+def _renovation_priorities(cls_idx: int, heating_high: bool, hot_water_high: bool) -> tuple:
+    if cls_idx <= 3:  # A-D: most common case, precomputed
+        return _GREEN_PRIORITIES
+
+    priorities = []
+
+    # Heating is usually the biggest lever
+    if heating_high:
+        priorities.append("Isolation thermique (combles, murs, planchers)")
+        priorities.append("Remplacement du système de chauffage (pompe à chaleur)")
+
+    # Hot water optimization
+    if hot_water_high:
+        priorities.append("Chauffe-eau thermodynamique ou solaire")
+
+    # Windows for F/G properties
+    if cls_idx >= 5:
+        priorities.append("Remplacement des fenêtres (double/triple vitrage)")
+        priorities.append("Installation d'une VMC double flux")
+
+    # Renewable energy - capped at 5 priorities without a slice copy
+    if len(priorities) < 5:
+        priorities.append("Panneaux solaires photovoltaïques (autoconsommation)")
+
+    return tuple(priorities)
+
+
+@lru_cache(maxsize=4096)
+def _renovation_costs(cls_idx: int, surface_m2: int) -> tuple:
+    rates = _RENOVATION_COST_PER_M2.get(cls_idx)
+    if rates is None:
+        return (0, 0)  # No urgent renovation needed
+    return (rates[0] * surface_m2, rates[1] * surface_m2)
+
+
+@dataclass(slots=True, frozen=True)
 class EnergyConsumption:
-    """Energy consumption breakdown by source"""
+    """Energy consumption breakdown by source (immutable, slotted)"""
     heating_kwh: float
     hot_water_kwh: float
     cooling_kwh: float
     lighting_kwh: float
     auxiliary_kwh: float  # Ventilation, pumps, etc.
 
-    @property
-    def total_final_energy(self) -> float:
-        """Total final energy consumption (kWh/m²/year)"""
-        return (
-            self.heating_kwh +
-            self.hot_water_kwh +
-            self.cooling_kwh +
-            self.lighting_kwh +
-            self.auxiliary_kwh
+    # Total final energy (kWh/m²/year), summed once at construction - the
+    # full calculation reads it several times, so a plain slot beats a
+    # property re-summing five floats per access
+    total_final_energy: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            'total_final_energy',
+            self.heating_kwh + self.hot_water_kwh + self.cooling_kwh +
+            self.lighting_kwh + self.auxiliary_kwh
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DPE2026Result:
-    """Complete DPE 2026 calculation result"""
+    """Complete DPE 2026 calculation result (immutable, slotted)"""
     # Original ADEME data
     original_classification: DPEClassification
     original_primary_energy: float  # kWh EP/m²/year (old 2.3 factor)
@@ -84,15 +263,81 @@ class DPE2026Result:
     estimated_energy_cost_annual: float  # EUR/year
     potential_value_loss_percent: float  # % depreciation
 
-    # AI Act compliance
-    calculation_metadata: Dict
-    ai_transparency_badge: bool = True
-    human_verification_required: bool = False
+    # AI Act compliance (the metadata dict itself is built lazily - see
+    # the calculation_metadata property)
+    calculation_date: str
+    electricity_factor_used: float
+    confidence_level: str
 
     # Renovation recommendations
-    priority_renovations: List[str]
+    priority_renovations: tuple  # of str, immutable (shared from the memo cache)
     estimated_renovation_cost_range: tuple  # (min, max) in EUR
 
+    # AI Act flags (defaults last - dataclasses require it)
+    ai_transparency_badge: bool = True
+    human_verification_required: bool = False
+    # Lazily populated by calculation_metadata; excluded from __init__,
+    # __repr__ and comparisons so a read-through never changes equality or
+    # (frozen-enabled) hashability of otherwise-identical results
+    _metadata_cache: Optional[Dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_row(cls, row) -> "DPE2026Result":
+        """
+        Rehydrate a full result from one calculate_batch record
+
+        Compatibility path for callers that need the dataclass API for a
+        handful of rows; batch consumers should serialize the structured
+        array directly. The batch path carries no original ADEME class, so
+        original_* mirror the recalculated values.
+        """
+        recalc_idx = int(row['recalc_cls'])
+        recalc_cls = _DPE_CLASSES[recalc_idx]
+        primary = float(row['primary_e'])
+        urgency = _URGENCY_BY_INDEX[int(row['urgency'])]
+        is_passoire = bool(row['is_passoire'])
+        return cls(
+            original_classification=recalc_cls,
+            original_primary_energy=primary,
+            recalculated_primary_energy=primary,
+            recalculated_classification=recalc_cls,
+            is_passoire_thermique=is_passoire,
+            renovation_urgency=urgency,
+            rental_ban_date=_BAN_DATES[recalc_idx] if int(row['ban_year']) else None,
+            estimated_energy_cost_annual=float(row['cost']),
+            potential_value_loss_percent=float(row['depreciation']),
+            calculation_date=datetime.now().isoformat(),
+            electricity_factor_used=DPE2026Calculator.ELECTRICITY_FACTOR_2026,
+            confidence_level='medium',
+            priority_renovations=_renovation_priorities(recalc_idx, False, False),
+            estimated_renovation_cost_range=_renovation_costs(recalc_idx, int(row['surface'])),
+            human_verification_required=is_passoire and (
+                urgency is RenovationUrgency.URGENT or urgency is RenovationUrgency.CRITICAL
+            ),
+        )
+
+    @property
+    def calculation_metadata(self) -> Dict:
+        """
+        AI Act compliance metadata, built on first access
+
+        Portfolio summary callers only read classification and cost;
+        deferring the 6-entry dict skips its allocation for every result
+        that never serializes it.
+        """
+        if self._metadata_cache is None:
+            object.__setattr__(self, '_metadata_cache', {
+                'calculation_date': self.calculation_date,
+                'electricity_factor_used': self.electricity_factor_used,
+                'regulatory_framework': _METADATA_REGULATORY_FRAMEWORK,
+                'methodology': _METADATA_METHODOLOGY,
+                'data_sources': list(_METADATA_DATA_SOURCES),
+                'confidence_level': self.confidence_level,
+            })
+        return self._metadata_cache
+
 
 class DPE2026Calculator:
     """
@@ -145,7 +390,58 @@ class DPE2026Calculator:
             enable_ai_transparency: Include AI transparency badges (EU AI Act)
         """
         self.enable_ai_transparency = enable_ai_transparency
-        logger.info(f"DPE2026Calculator initialized with electricity factor {self.ELECTRICITY_FACTOR_2026}")
+
+        # Timestamp shared across a batch of calculations (see batch_timestamp)
+        self._batch_timestamp: Optional[str] = None
+
+        # Specialize the weighted-factor formula for this deployment's
+        # regulatory constants. The module kernel has the default 2026 factors
+        # baked in as literals; if a subclass overrides them (e.g. a future
+        # decree revision), generate an equivalent function with the new
+        # values folded in at compile time rather than re-reading class
+        # attributes on every call. Re-instantiating picks up factor changes.
+        if (
+            self.ELECTRICITY_FACTOR_2026,
+            self.GAS_FACTOR,
+            self.FUEL_OIL_FACTOR,
+            self.WOOD_FACTOR,
+        ) == (1.9, 1.0, 1.0, 0.6):
+            self._recalc = _recalc_primary
+        else:
+            src = (
+                "def _recalc(total_final, elec_pct, gas_pct, oil_pct, wood_pct):\n"
+                f"    return total_final * (elec_pct * {self.ELECTRICITY_FACTOR_2026}"
+                f" + gas_pct * {self.GAS_FACTOR} + oil_pct * {self.FUEL_OIL_FACTOR}"
+                f" + wood_pct * {self.WOOD_FACTOR})\n"
+            )
+            namespace: Dict[str, object] = {}
+            exec(compile(src, '<dpe-recalc>', 'exec'), namespace)
+            self._recalc = namespace['_recalc']
+
+        # The fused scalar kernel has both the default conversion factors
+        # and the default EUR/kWh rates baked in as literals; any override
+        # must take the composable path in calculate_full_dpe_2026 instead
+        self._use_fused_kernel = (
+            self._recalc is _recalc_primary
+            and self.ENERGY_COSTS == DPE2026Calculator.ENERGY_COSTS
+        )
+
+        logger.info("DPE2026Calculator initialized with electricity factor %s", self.ELECTRICITY_FACTOR_2026)
+
+    @contextmanager
+    def batch_timestamp(self):
+        """
+        Share one calculation timestamp across many calculations
+
+        datetime.now().isoformat() costs a clock syscall plus string
+        formatting per call; when scoring a portfolio, wrap the loop in this
+        context manager so every result reuses a single timestamp.
+        """
+        self._batch_timestamp = datetime.now().isoformat()
+        try:
+            yield
+        finally:
+            self._batch_timestamp = None
 
     def classify_energy_performance(self, primary_energy_kwh: float) -> DPEClassification:
         """
@@ -157,10 +453,9 @@ class DPE2026Calculator:
         Returns:
             DPE classification (A-G)
         """
-        for classification, (min_val, max_val) in self.DPE_THRESHOLDS.items():
-            if min_val <= primary_energy_kwh <= max_val:
-                return classification
-        return DPEClassification.G  # Fallback
+        # bisect_left on the 6 upper bounds: O(log N) in C, no Python loop,
+        # and values above 420 naturally land on G
+        return _DPE_CLASSES[bisect.bisect_left(_DPE_BOUNDS, primary_energy_kwh)]
 
     def recalculate_with_2026_factor(
         self,
@@ -181,29 +476,20 @@ class DPE2026Calculator:
         """
         total_final = final_energy_consumption.total_final_energy
 
-        # Calculate weighted conversion factor
-        weighted_factor = 0.0
-
-        # Electricity component
-        weighted_factor += electricity_percentage * self.ELECTRICITY_FACTOR_2026
-
-        # Other energy sources
-        for source, percentage in other_energy_sources.items():
-            if source == 'gas':
-                weighted_factor += percentage * self.GAS_FACTOR
-            elif source == 'fuel_oil':
-                weighted_factor += percentage * self.FUEL_OIL_FACTOR
-            elif source == 'wood':
-                weighted_factor += percentage * self.WOOD_FACTOR
-
-        # Apply conversion
-        primary_energy = total_final * weighted_factor
-
-        logger.info(
-            f"Recalculated: {total_final:.2f} kWh final → "
-            f"{primary_energy:.2f} kWh EP (factor: {weighted_factor:.2f})"
+        # Extract the known sources once and hand the arithmetic to the
+        # specialized function - no dict iteration or string compares per call
+        primary_energy = self._recalc(
+            total_final,
+            electricity_percentage,
+            other_energy_sources.get('gas', 0.0),
+            other_energy_sources.get('fuel_oil', 0.0),
+            other_energy_sources.get('wood', 0.0),
         )
 
+        # Skip record construction entirely when INFO is off for this logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Recalculated: %.2f kWh final → %.2f kWh EP", total_final, primary_energy)
+
         return primary_energy
 
     def calculate_renovation_urgency(
@@ -221,17 +507,7 @@ class DPE2026Calculator:
         Returns:
             Renovation urgency level
         """
-        if not is_rental_property:
-            return RenovationUrgency.COMPLIANT
-
-        if classification == DPEClassification.G:
-            return RenovationUrgency.CRITICAL
-        elif classification == DPEClassification.F:
-            return RenovationUrgency.URGENT
-        elif classification == DPEClassification.E:
-            return RenovationUrgency.WARNING
-        else:
-            return RenovationUrgency.COMPLIANT
+        return _renovation_urgency(classification, is_rental_property)
 
     def estimate_energy_costs(
         self,
@@ -250,14 +526,22 @@ class DPE2026Calculator:
         Returns:
             Estimated annual cost (EUR/year)
         """
-        total_cost = 0.0
-        total_consumption = final_energy_kwh * surface_m2
-
-        for source, percentage in energy_mix.items():
-            source_consumption = total_consumption * percentage
-            cost_per_kwh = self.ENERGY_COSTS.get(source, 0.15)  # Default fallback
-            total_cost += source_consumption * cost_per_kwh
+        # The unrolled kernel has the default 2026 rates baked in; tariff
+        # overrides fall back to the generic dict walk
+        if self.ENERGY_COSTS == DPE2026Calculator.ENERGY_COSTS:
+            return _estimate_energy_costs(
+                final_energy_kwh * surface_m2,
+                energy_mix.get('electricity', 0.0),
+                energy_mix.get('gas', 0.0),
+                energy_mix.get('fuel_oil', 0.0),
+                energy_mix.get('wood', 0.0),
+            )
 
+        total_consumption = final_energy_kwh * surface_m2
+        total_cost = sum(
+            total_consumption * percentage * self.ENERGY_COSTS.get(source, 0.15)
+            for source, percentage in energy_mix.items()
+        )
         return round(total_cost, 2)
 
     def calculate_value_depreciation(
@@ -280,29 +564,13 @@ class DPE2026Calculator:
         Returns:
             Estimated depreciation percentage (0-100)
         """
-        base_depreciation = {
-            DPEClassification.A: 0.0,
-            DPEClassification.B: 0.0,
-            DPEClassification.C: 0.0,
-            DPEClassification.D: 0.0,
-            DPEClassification.E: 6.5,
-            DPEClassification.F: 12.0,
-            DPEClassification.G: 16.0
-        }
-
-        depreciation = base_depreciation.get(classification, 0.0)
-
-        # Amplify for rental properties facing ban
-        if is_rental_property and classification in [DPEClassification.F, DPEClassification.G]:
-            depreciation *= 1.25  # 25% additional depreciation
-
-        return round(depreciation, 1)
+        return _value_depreciation(classification, is_rental_property)
 
     def generate_renovation_priorities(
         self,
         classification: DPEClassification,
         consumption: EnergyConsumption
-    ) -> List[str]:
+    ) -> tuple:
         """
         Generate prioritized renovation recommendations
 
@@ -311,28 +579,15 @@ class DPE2026Calculator:
             consumption: Energy consumption breakdown
 
         Returns:
-            List of prioritized renovation actions
+            Tuple of up to 5 prioritized renovation actions
         """
-        priorities = []
-
-        # Heating is usually the biggest lever
-        if consumption.heating_kwh > 150:
-            priorities.append("Isolation thermique (combles, murs, planchers)")
-            priorities.append("Remplacement du système de chauffage (pompe à chaleur)")
-
-        # Hot water optimization
-        if consumption.hot_water_kwh > 50:
-            priorities.append("Chauffe-eau thermodynamique ou solaire")
-
-        # Windows for F/G properties
-        if classification in [DPEClassification.F, DPEClassification.G]:
-            priorities.append("Remplacement des fenêtres (double/triple vitrage)")
-            priorities.append("Installation d'une VMC double flux")
-
-        # Renewable energy
-        priorities.append("Panneaux solaires photovoltaïques (autoconsommation)")
-
-        return priorities[:5]  # Top 5 priorities
+        # Bucket the consumption to the two thresholds that matter so the
+        # memoized helper sees a tiny key space
+        return _renovation_priorities(
+            classification,
+            consumption.heating_kwh > 150,
+            consumption.hot_water_kwh > 50
+        )
 
     def estimate_renovation_costs(
         self,
@@ -354,21 +609,112 @@ class DPE2026Calculator:
         Returns:
             (min_cost, max_cost) tuple in EUR
         """
-        cost_per_m2 = {
-            DPEClassification.E: (150, 250),
-            DPEClassification.F: (300, 500),
-            DPEClassification.G: (500, 800)
-        }
-
-        if classification not in cost_per_m2:
-            return (0, 0)  # No urgent renovation needed
-
-        min_rate, max_rate = cost_per_m2[classification]
-        return (
-            int(min_rate * surface_m2),
-            int(max_rate * surface_m2)
+        # Surface bucketed to whole m² to keep the memo hit rate high
+        return _renovation_costs(classification, int(surface_m2))
+
+    def calculate_batch(self, arrays: Dict[str, "np.ndarray"]) -> "np.ndarray":
+        """
+        Vectorized DPE 2026 scoring for portfolio-sized inputs
+
+        One pass over contiguous arrays replaces per-property Python dispatch;
+        results are written into a preallocated structured array (one record
+        per property, no per-row object allocation), which batch callers
+        (portfolio endpoints) serialize directly. Use DPE2026Result.from_row
+        to rehydrate the dataclass API for individual rows.
+
+        Args:
+            arrays: struct-of-arrays input with keys heating_kwh,
+                hot_water_kwh, cooling_kwh, lighting_kwh, auxiliary_kwh,
+                electricity_pct, surface_m2, is_rental plus optional
+                gas_pct, fuel_oil_pct, wood_pct
+
+        Returns:
+            Structured np.ndarray with fields recalc_cls (0=A..6=G),
+            primary_e, cost, depreciation, surface, ban_year (0 = none),
+            urgency (index into _URGENCY_BY_INDEX) and is_passoire
+        """
+        import numpy as np
+
+        global _RESULT_DTYPE
+        if _RESULT_DTYPE is None:
+            _RESULT_DTYPE = np.dtype(list(_RESULT_FIELDS))
+
+        # float32 throughout the batch path: energy values live in [0, ~800]
+        # and percentages in [0, 1], where single precision is exact far beyond
+        # the ±5% the inputs are measured to - and half the memory traffic
+        # doubles SIMD throughput on this memory-bound kernel. The scalar path
+        # stays float64.
+        heating = np.asarray(arrays['heating_kwh'], dtype=np.float32)
+        hot_water = np.asarray(arrays['hot_water_kwh'], dtype=np.float32)
+        cooling = np.asarray(arrays['cooling_kwh'], dtype=np.float32)
+        lighting = np.asarray(arrays['lighting_kwh'], dtype=np.float32)
+        auxiliary = np.asarray(arrays['auxiliary_kwh'], dtype=np.float32)
+        elec_pct = np.asarray(arrays['electricity_pct'], dtype=np.float32)
+        surface = np.asarray(arrays['surface_m2'], dtype=np.float32)
+        is_rental = np.asarray(arrays['is_rental'], dtype=bool)
+
+        zeros = np.zeros_like(heating)
+        gas_pct = np.asarray(arrays.get('gas_pct', zeros), dtype=np.float32)
+        oil_pct = np.asarray(arrays.get('fuel_oil_pct', zeros), dtype=np.float32)
+        wood_pct = np.asarray(arrays.get('wood_pct', zeros), dtype=np.float32)
+
+        # Primary energy with the 2026 weighted conversion factor
+        total_final = heating + hot_water + cooling + lighting + auxiliary
+        weighted_factor = (
+            elec_pct * self.ELECTRICITY_FACTOR_2026
+            + gas_pct * self.GAS_FACTOR
+            + oil_pct * self.FUEL_OIL_FACTOR
+            + wood_pct * self.WOOD_FACTOR
+        )
+        primary_energy = total_final * weighted_factor
+
+        # Branchless classification: summing the six boundary compares beats
+        # searchsorted for this few thresholds (predicated SIMD compares, no
+        # per-element binary search), and matches the scalar kernel exactly
+        class_index = (primary_energy > _DPE_BOUNDS[0]).astype(np.int8)
+        for bound in _DPE_BOUNDS[1:]:
+            class_index += primary_energy > bound
+        is_passoire = class_index >= 5  # F or G
+
+        # Annual energy cost from the per-source 2026 rates
+        costs = self.ENERGY_COSTS
+        cost_per_kwh = (
+            elec_pct * costs['electricity']
+            + gas_pct * costs['gas']
+            + oil_pct * costs['fuel_oil']
+            + wood_pct * costs['wood']
+        )
+        annual_cost = np.round(total_final * surface * cost_per_kwh, 2)
+
+        # Value depreciation, amplified 25% for rentals facing the ban
+        depreciation = np.asarray(_DEPRECIATION, dtype=np.float32)[class_index]
+        depreciation = np.round(
+            np.where(is_rental & is_passoire, depreciation * 1.25, depreciation), 1
+        )
+
+        # Write every column into one preallocated compound-dtype buffer -
+        # a single heap allocation for the whole batch
+        out = np.empty(heating.shape[0], dtype=_RESULT_DTYPE)
+        out['recalc_cls'] = class_index
+        out['primary_e'] = primary_energy
+        out['cost'] = annual_cost
+        out['depreciation'] = depreciation
+        out['surface'] = surface
+        out['ban_year'] = np.where(
+            is_rental, np.asarray(_BAN_YEARS, dtype=np.int16)[class_index], 0
+        )
+        out['urgency'] = np.where(
+            is_rental, np.asarray(_RENTAL_URGENCY_IDS, dtype=np.uint8)[class_index], 0
+        )
+        out['is_passoire'] = is_passoire
+
+        logger.info(
+            "Batch DPE 2026 calculation complete: %d properties, %d passoires thermiques",
+            out.shape[0], int(is_passoire.sum())
         )
 
+        return out
+
     def calculate_full_dpe_2026(
         self,
         original_dpe_class: str,
@@ -396,61 +742,74 @@ class DPE2026Calculator:
         Returns:
             Complete DPE2026Result with all calculations and recommendations
         """
-        logger.info(f"Starting DPE 2026 calculation for {surface_m2}m² property")
-
-        # Step 1: Recalculate with new 2026 factor
-        recalculated_primary = self.recalculate_with_2026_factor(
-            final_energy_consumption,
-            electricity_percentage,
-            other_energy_sources
-        )
-
-        # Step 2: Reclassify
-        original_class = DPEClassification(original_dpe_class)
-        recalculated_class = self.classify_energy_performance(recalculated_primary)
-
-        # Step 3: Determine passoire thermique status
-        is_passoire = recalculated_class in [DPEClassification.F, DPEClassification.G]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting DPE 2026 calculation for %sm² property", surface_m2)
+
+        # Steps 1+2+6 fused: recalculate with the 2026 factor, reclassify and
+        # estimate the annual cost in a single compiled kernel pass. The
+        # kernel bakes in the default factors and tariffs, so overridden
+        # constants take the composable methods instead (see __init__)
+        if self._use_fused_kernel:
+            recalculated_primary, recalculated_idx, annual_cost = _dpe_kernel(
+                final_energy_consumption.total_final_energy,
+                electricity_percentage,
+                other_energy_sources.get('gas', 0.0),
+                other_energy_sources.get('fuel_oil', 0.0),
+                other_energy_sources.get('wood', 0.0),
+                surface_m2,
+            )
+            recalculated_idx = int(recalculated_idx)
+            annual_cost = round(annual_cost, 2)
+        else:
+            recalculated_primary = self._recalc(
+                final_energy_consumption.total_final_energy,
+                electricity_percentage,
+                other_energy_sources.get('gas', 0.0),
+                other_energy_sources.get('fuel_oil', 0.0),
+                other_energy_sources.get('wood', 0.0),
+            )
+            recalculated_idx = int(self.classify_energy_performance(recalculated_primary))
+            annual_cost = self.estimate_energy_costs(
+                final_energy_consumption.total_final_energy,
+                surface_m2,
+                {'electricity': electricity_percentage, **other_energy_sources},
+            )
+
+        original_class = DPEClassification.from_letter(original_dpe_class)
+        recalculated_class = _DPE_CLASSES[recalculated_idx]
+
+        # Step 3: Determine passoire thermique status (F/G)
+        is_passoire = recalculated_idx >= 5
+
+        # Steps 4-7 call the module-level memoized helpers directly with the
+        # class index already in hand - no self.* attribute walks or wrapper
+        # frames on the hot path
 
         # Step 4: Calculate renovation urgency
-        urgency = self.calculate_renovation_urgency(recalculated_class, is_rental_property)
+        urgency = _renovation_urgency(recalculated_idx, is_rental_property)
 
         # Step 5: Determine rental ban date
-        rental_ban = None
-        if is_rental_property and recalculated_class in self.RENTAL_BAN_DATES:
-            rental_ban = self.RENTAL_BAN_DATES[recalculated_class]
-
-        # Step 6: Financial estimations
-        energy_mix = {'electricity': electricity_percentage, **other_energy_sources}
-        annual_cost = self.estimate_energy_costs(
-            final_energy_consumption.total_final_energy,
-            surface_m2,
-            energy_mix
-        )
-        value_loss = self.calculate_value_depreciation(recalculated_class, is_rental_property)
+        rental_ban = _BAN_DATES[recalculated_idx] if is_rental_property else None
+
+        # Step 6: Financial estimations (annual cost came out of the kernel)
+        value_loss = _value_depreciation(recalculated_idx, is_rental_property)
 
         # Step 7: Renovation recommendations
-        priorities = self.generate_renovation_priorities(
-            recalculated_class,
-            final_energy_consumption
+        priorities = _renovation_priorities(
+            recalculated_idx,
+            final_energy_consumption.heating_kwh > 150,
+            final_energy_consumption.hot_water_kwh > 50
         )
-        cost_range = self.estimate_renovation_costs(recalculated_class, surface_m2)
-
-        # Step 8: Build metadata (AI Act compliance)
-        metadata = {
-            'calculation_date': datetime.now().isoformat(),
-            'electricity_factor_used': self.ELECTRICITY_FACTOR_2026,
-            'regulatory_framework': 'Loi Climat et Résilience 2026 + EU EPBD 2024',
-            'methodology': 'DPE 3CL-2021 (updated Jan 2026)',
-            'data_sources': ['ADEME DPE API', 'DVF Gouv'],
-            'confidence_level': 'high' if electricity_percentage > 0.8 else 'medium'
-        }
+        cost_range = _renovation_costs(recalculated_idx, int(surface_m2))
+
+        # Step 8: Metadata inputs (AI Act compliance) - only the dynamic
+        # values are computed here; the dict is assembled lazily on access
 
         # Step 9: Determine if human verification needed (EU AI Act Art. 14)
         human_verification = (
             is_passoire and
             is_rental_property and
-            urgency in [RenovationUrgency.URGENT, RenovationUrgency.CRITICAL]
+            (urgency is RenovationUrgency.URGENT or urgency is RenovationUrgency.CRITICAL)
         )
 
         result = DPE2026Result(
@@ -463,18 +822,21 @@ class DPE2026Calculator:
             rental_ban_date=rental_ban,
             estimated_energy_cost_annual=annual_cost,
             potential_value_loss_percent=value_loss,
-            calculation_metadata=metadata,
+            calculation_date=self._batch_timestamp or datetime.now().isoformat(),
+            electricity_factor_used=self.ELECTRICITY_FACTOR_2026,
+            confidence_level='high' if electricity_percentage > 0.8 else 'medium',
             ai_transparency_badge=self.enable_ai_transparency,
             human_verification_required=human_verification,
             priority_renovations=priorities,
             estimated_renovation_cost_range=cost_range
         )
 
-        logger.info(
-            f"DPE 2026 calculation complete: "
-            f"{original_class.value} → {recalculated_class.value} "
-            f"({original_primary_energy:.1f} → {recalculated_primary:.1f} kWh EP/m²/year)"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "DPE 2026 calculation complete: %s → %s (%.1f → %.1f kWh EP/m²/year)",
+                original_class.letter, recalculated_class.letter,
+                original_primary_energy, recalculated_primary
+            )
 
         return result
 
@@ -508,9 +870,9 @@ if __name__ == "__main__":
     print("\n" + "="*60)
     print("DPE 2026 RECALCULATION REPORT")
     print("="*60)
-    print(f"Original: {result.original_classification.value} "
+    print(f"Original: {result.original_classification.letter} "
           f"({result.original_primary_energy:.1f} kWh EP/m²/year)")
-    print(f"Recalculated: {result.recalculated_classification.value} "
+    print(f"Recalculated: {result.recalculated_classification.letter} "
           f"({result.recalculated_primary_energy:.1f} kWh EP/m²/year)")
     print(f"Passoire Thermique: {'OUI ⚠️' if result.is_passoire_thermique else 'Non'}")
     print(f"Urgency: {result.renovation_urgency.value.upper()}")
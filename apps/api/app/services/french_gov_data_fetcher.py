@@ -16,20 +16,32 @@ Date: January 2026
 """
 
 import asyncio
-import hashlib
 import logging
+import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, List, Optional
 from urllib.parse import urlencode
 
 import aiohttp
+import msgspec
+import numpy as np
+import orjson
+import pandas as pd
 import redis.asyncio as redis
-from pydantic import BaseModel, Field
+import xxhash
+from aiolimiter import AsyncLimiter
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 
-class DVFTransaction(BaseModel):
+# The record models are msgspec Structs rather than pydantic models: they are
+# plain data containers with no custom validators, and C-level Struct
+# construction plus whole-list JSON decoding is 50-100x faster than running
+# a pydantic constructor per record on the parse hot path
+class DVFTransaction(msgspec.Struct, frozen=True):
     """Property transaction from DVF database"""
     id_mutation: str
     date_mutation: datetime
@@ -47,7 +59,7 @@ class DVFTransaction(BaseModel):
     latitude: Optional[float]
 
 
-class DPEDiagnostic(BaseModel):
+class DPEDiagnostic(msgspec.Struct, frozen=True):
     """Energy performance diagnostic from ADEME"""
     n_dpe: str  # Unique identifier
     date_etablissement_dpe: datetime
@@ -69,6 +81,106 @@ class DPEDiagnostic(BaseModel):
     conso_auxiliaires: Optional[float]
 
 
+# Record-extraction tables for the parse loops: the per-record fourteen-plus
+# `fields.get(...)` calls each paid a method lookup and bytecode dispatch.
+# Merging defaults once ({**defaults, **record}) and pulling every value in
+# a single C-level itemgetter call roughly halves the opcodes per record.
+# Key order matches the Struct field order, so construction is positional.
+_DVF_DEFAULTS = {
+    'id_mutation': '',
+    'date_mutation': '',
+    'nature_mutation': '',
+    'valeur_fonciere': 0,
+    'adresse_numero': None,
+    'adresse_nom_voie': None,
+    'code_postal': '',
+    'code_commune': '',
+    'nom_commune': '',
+    'type_local': '',
+    'surface_reelle_bati': None,
+    'nombre_pieces_principales': None,
+    'longitude': None,
+    'latitude': None,
+}
+_DVF_GETTER = itemgetter(*_DVF_DEFAULTS)
+
+_DPE_DEFAULTS = {
+    'N°DPE': '',
+    'Date_établissement_DPE': '',
+    'Classe_consommation_énergie': '',
+    'Classe_estimation_GES': '',
+    'Consommation_énergie': 0,
+    'Estimation_GES': 0,
+    'Code_postal_(BAN)': '',
+    'Type_bâtiment': '',
+    'Année_construction': None,
+    'Surface_habitable_logement': 0,
+    'Type_énergie_principale_chauffage': '',
+    'Type_installation_chauffage': None,
+    'Type_énergie_n°1': None,
+    'Conso_chauffage_é_finale': None,
+    'Conso_ECS_é_finale': None,
+    'Conso_refroidissement_é_finale': None,
+    'Conso_éclairage_é_finale': None,
+    'Conso_auxiliaires_é_finale': None,
+}
+_DPE_GETTER = itemgetter(*_DPE_DEFAULTS)
+
+
+# Whole-list (de)serializers for the parsed-model cache: one C call per hit
+# instead of re-running each constructor, with the decoder instances reused
+# across requests
+_DVF_LIST_DECODER = msgspec.json.Decoder(List[DVFTransaction])
+_DPE_LIST_DECODER = msgspec.json.Decoder(List[DPEDiagnostic])
+_STRUCT_ENCODER = msgspec.json.Encoder()
+
+# Bodies above this size are parsed in a worker thread: a synchronous decode
+# of a 200-record page blocks the event loop and starves concurrent fetches,
+# while small payloads stay inline to skip executor scheduling overhead
+_OFFLOAD_PARSE_BYTES = 64_000
+
+# Sentinel returned by the fetch helpers when a conditional request came back
+# 304 Not Modified: the caller's cached body is still current and no payload
+# was downloaded. Typed Any so the Optional[Dict] signatures stay honest.
+_NOT_MODIFIED: Any = object()
+
+
+async def _parse_offloading(parser, raw: bytes):
+    """Run parser(raw), hopping to the default executor for large bodies"""
+    if len(raw) > _OFFLOAD_PARSE_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(None, parser, raw)
+    return parser(raw)
+
+
+def _quote_odsql(value) -> str:
+    """Quote a literal for the opendatasoft WHERE DSL (embedded quotes doubled)"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _quote_q(value) -> str:
+    """Quote a literal term for the data-fair q syntax (embedded quotes stripped)"""
+    return '"' + str(value).replace('"', '') + '"'
+
+
+# Precompiled filter builders: (kwarg name, fragment formatter). One tuple
+# walk per call instead of five branch-and-append f-strings, and every value
+# passes through a quoting helper - interpolating raw caller input into the
+# API query DSLs was an injection vector
+_DVF_FILTERS = (
+    ('code_postal', lambda v: "code_postal=" + _quote_odsql(v)),
+    ('code_commune', lambda v: "code_commune=" + _quote_odsql(v)),
+    ('date_min', lambda v: "date_mutation>=" + _quote_odsql(v.strftime('%Y-%m-%d'))),
+    ('date_max', lambda v: "date_mutation<=" + _quote_odsql(v.strftime('%Y-%m-%d'))),
+    ('type_local', lambda v: "type_local=" + _quote_odsql(v)),
+)
+_DPE_FILTERS = (
+    ('code_postal', lambda v: "Code_postal_(BAN):" + _quote_q(v)),
+    ('classe_consommation', lambda v: "Classe_consommation_énergie:" + _quote_q(v)),
+    ('type_batiment', lambda v: "Type_bâtiment:" + _quote_q(v)),
+    ('date_min', lambda v: "Date_établissement_DPE:>=" + v.strftime('%Y-%m-%d')),
+)
+
+
 class GDPRConfig(BaseModel):
     """GDPR compliance configuration"""
     anonymization_level: str = "postal_code"  # "postal_code", "commune", "department"
@@ -90,6 +202,16 @@ class FrenchGovDataFetcher:
     CACHE_TTL_DVF = 86400  # 24 hours (DVF data is updated monthly)
     CACHE_TTL_DPE = 43200  # 12 hours (DPE data is updated weekly)
 
+    # Expiry index for hash-bucketed cache entries (hash fields have no
+    # native TTL) and the sweep cadence of the background task
+    CACHE_EXPIRE_ZSET = "ecoimmo:cache:expire"
+    CACHE_SWEEP_INTERVAL = 60  # seconds
+
+    # Entries stored with HTTP validators (ETag / Last-Modified) are kept
+    # this long past their freshness deadline: a stale body plus a 304
+    # response is a refresh that downloads and re-stores nothing
+    CACHE_REVALIDATE_GRACE = 86400 * 7  # 7 days
+
     # Rate limiting (requests per minute)
     RATE_LIMIT_DVF = 30
     RATE_LIMIT_DPE = 60
@@ -98,6 +220,12 @@ class FrenchGovDataFetcher:
     MAX_RETRIES = 3
     RETRY_BACKOFF_SECONDS = [1, 3, 9]  # Exponential backoff
 
+    # One HTTP session shared by every fetcher instance: request-scoped
+    # fetchers then reuse warm keep-alive connections instead of paying a
+    # TCP+TLS handshake per instance. Refcounted so the last close() wins.
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    _session_refcount: ClassVar[int] = 0
+
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379/0",
@@ -115,6 +243,13 @@ class FrenchGovDataFetcher:
         self.gdpr_config = gdpr_config or GDPRConfig()
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # Per-endpoint concurrency controls, created in connect()
+        self._dvf_sem: Optional[asyncio.Semaphore] = None
+        self._dpe_sem: Optional[asyncio.Semaphore] = None
+        self._dvf_limiter: Optional[AsyncLimiter] = None
+        self._dpe_limiter: Optional[AsyncLimiter] = None
+        self._sweeper_task: Optional[asyncio.Task] = None
+
         logger.info(f"FrenchGovDataFetcher initialized with GDPR level: {self.gdpr_config.anonymization_level}")
 
     async def __aenter__(self):
@@ -127,74 +262,262 @@ class FrenchGovDataFetcher:
         await self.close()
 
     async def connect(self):
-        """Establish connections to Redis and HTTP session"""
+        """Establish connections to Redis and the shared HTTP session"""
         self.redis_client = await redis.from_url(self.redis_url, decode_responses=False)
-        self.session = aiohttp.ClientSession(
-            headers={
-                "User-Agent": "EcoImmoFrance/2026 (GDPR-Compliant Real Estate Platform)",
-                "Accept": "application/json"
-            },
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
-        logger.info("Connections established (Redis + HTTP)")
+
+        # Concurrency caps (in-flight requests) and token buckets (requests
+        # per minute) per endpoint - the documented rate limits enforced in
+        # code instead of left to the caller's discipline
+        self._dvf_sem = asyncio.Semaphore(10)
+        self._dpe_sem = asyncio.Semaphore(20)
+        self._dvf_limiter = AsyncLimiter(self.RATE_LIMIT_DVF, 60)
+        self._dpe_limiter = AsyncLimiter(self.RATE_LIMIT_DPE, 60)
+
+        if FrenchGovDataFetcher._session is None or FrenchGovDataFetcher._session.closed:
+            # Explicit connector caps: limit_per_host keeps a slow
+            # data.economie.gouv.fr from starving data.ademe.fr (and vice
+            # versa), ttl_dns_cache skips re-resolution for 5 minutes
+            FrenchGovDataFetcher._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                headers={
+                    "User-Agent": "EcoImmoFrance/2026 (GDPR-Compliant Real Estate Platform)",
+                    "Accept": "application/json"
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        FrenchGovDataFetcher._session_refcount += 1
+        self.session = FrenchGovDataFetcher._session
+
+        # Background sweeper deleting expired hash-bucketed cache entries
+        self._sweeper_task = asyncio.create_task(self._sweep_loop())
+
+        logger.info("Connections established (Redis + shared HTTP session)")
 
     async def close(self):
-        """Close all connections"""
+        """Close connections (the shared HTTP session closes with its last user)"""
+        if self._sweeper_task:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
         if self.redis_client:
             await self.redis_client.close()
         if self.session:
-            await self.session.close()
+            self.session = None
+            FrenchGovDataFetcher._session_refcount -= 1
+            if FrenchGovDataFetcher._session_refcount <= 0 and FrenchGovDataFetcher._session:
+                await FrenchGovDataFetcher._session.close()
+                FrenchGovDataFetcher._session = None
         logger.info("Connections closed")
 
-    def _generate_cache_key(self, prefix: str, params: Dict) -> str:
+    def _generate_cache_ref(self, prefix: str, postal: Optional[str], params: Dict) -> tuple:
         """
-        Generate a consistent cache key from parameters
-
-        Args:
-            prefix: Cache key prefix (e.g., "dvf", "dpe")
-            params: Query parameters
-
-        Returns:
-            Cache key string
+        Generate the (hash bucket, field) pair addressing a cache entry
+
+        Entries live as fields of a per-postal-code Redis hash
+        (ecoimmo:{prefix}:{postal}): one hash header instead of a key
+        header per filter combination, and flushing a postal code after an
+        upstream refresh is a single DEL instead of a KEYS scan. The field
+        is the xxh3 hash of the full parameter set - the key only indexes
+        Redis (non-adversarial), and xxh3 is several times faster per byte
+        than MD5 with no OpenSSL call overhead.
         """
-        # Sort params for consistency
         sorted_params = sorted(params.items())
         params_str = urlencode(sorted_params)
-        hash_suffix = hashlib.md5(params_str.encode()).hexdigest()[:8]
-        return f"ecoimmo:{prefix}:{hash_suffix}"
+        field = f"{xxhash.xxh3_64_intdigest(params_str.encode()):016x}"[:8]
+        return f"ecoimmo:{prefix}:{postal or 'all'}", field
 
-    async def _get_from_cache(self, cache_key: str) -> Optional[bytes]:
-        """Retrieve data from Redis cache"""
+    def _parsed_cache_params(self, params: Dict) -> Dict:
+        """
+        Query params extended with the anonymization policy in force
+
+        Parsed DVF models are cached after GDPR anonymization, so the
+        policy is part of the cache identity: without it, a fetcher with
+        a different gdpr_config would be served models anonymized under
+        another fetcher's policy.
+        """
+        cfg = self.gdpr_config
+        return {
+            **params,
+            '_gdpr': f"{cfg.anonymization_level}:{int(cfg.include_exact_addresses)}",
+        }
+
+    async def _get_from_cache(self, bucket: str, field: str) -> Optional[bytes]:
+        """Retrieve one cache entry (hash field)"""
         if not self.redis_client:
             return None
 
         try:
-            data = await self.redis_client.get(cache_key)
+            data = await self.redis_client.hget(bucket, field)
             if data:
-                logger.info(f"Cache HIT: {cache_key}")
+                logger.info(f"Cache HIT: {bucket}[{field}]")
                 return data
-            logger.debug(f"Cache MISS: {cache_key}")
+            logger.debug(f"Cache MISS: {bucket}[{field}]")
             return None
         except Exception as e:
             logger.warning(f"Cache read error: {e}")
             return None
 
-    async def _set_to_cache(self, cache_key: str, data: bytes, ttl: int):
-        """Store data in Redis cache with TTL"""
+    async def _set_to_cache(
+        self,
+        bucket: str,
+        field: str,
+        data: bytes,
+        ttl: int,
+        meta: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Store one cache entry and index its expiry in the sweep ZSET
+
+        When the upstream response carried HTTP validators, pass them as
+        meta: they are stored under a sibling hash field and the body is
+        kept for CACHE_REVALIDATE_GRACE past its freshness deadline, so the
+        next refresh can be a conditional request answered by a bodyless
+        304 instead of a full re-download.
+        """
         if not self.redis_client:
             return
 
         try:
-            await self.redis_client.setex(cache_key, ttl, data)
-            logger.debug(f"Cached: {cache_key} (TTL: {ttl}s)")
+            now = time.time()
+            expire_at = now + ttl + (self.CACHE_REVALIDATE_GRACE if meta else 0)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(bucket, field, data)
+                pipe.zadd(self.CACHE_EXPIRE_ZSET, {f"{bucket}\x00{field}": expire_at})
+                if meta:
+                    meta_field = f"{field}:m"
+                    pipe.hset(bucket, meta_field, orjson.dumps({**meta, 'fresh_until': now + ttl}))
+                    pipe.zadd(self.CACHE_EXPIRE_ZSET, {f"{bucket}\x00{meta_field}": expire_at})
+                await pipe.execute()
+            logger.debug(f"Cached: {bucket}[{field}] (TTL: {ttl}s)")
         except Exception as e:
             logger.warning(f"Cache write error: {e}")
 
+    async def _get_cache_meta(self, bucket: str, field: str) -> Optional[Dict]:
+        """Retrieve the validator metadata stored alongside a cache entry"""
+        if not self.redis_client:
+            return None
+
+        try:
+            raw = await self.redis_client.hget(bucket, f"{field}:m")
+            return orjson.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Cache meta read error: {e}")
+            return None
+
+    async def _extend_cache_freshness(self, bucket: str, field: str, meta: Dict, ttl: int):
+        """
+        Mark a revalidated cache entry fresh again after a 304
+
+        Rewrites only the small meta field and the two expiry scores - the
+        cached body itself is untouched, which is the whole point of the
+        conditional refresh.
+        """
+        if not self.redis_client:
+            return
+
+        try:
+            now = time.time()
+            expire_at = now + ttl + self.CACHE_REVALIDATE_GRACE
+            meta_field = f"{field}:m"
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(bucket, meta_field, orjson.dumps({**meta, 'fresh_until': now + ttl}))
+                pipe.zadd(self.CACHE_EXPIRE_ZSET, {
+                    f"{bucket}\x00{field}": expire_at,
+                    f"{bucket}\x00{meta_field}": expire_at,
+                })
+                await pipe.execute()
+            logger.debug(f"Revalidated: {bucket}[{field}] (TTL: {ttl}s)")
+        except Exception as e:
+            logger.warning(f"Cache revalidation error: {e}")
+
+    async def _mget_from_cache(self, refs: List[tuple]) -> List[Optional[bytes]]:
+        """Retrieve many cache entries ((bucket, field) pairs) in one round-trip"""
+        if not self.redis_client or not refs:
+            return [None] * len(refs)
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for bucket, field in refs:
+                    pipe.hget(bucket, field)
+                values = await pipe.execute()
+            logger.info(f"Cache MGET: {sum(1 for v in values if v)}/{len(refs)} hits")
+            return values
+        except Exception as e:
+            logger.warning(f"Cache mget error: {e}")
+            return [None] * len(refs)
+
+    async def _mset_to_cache(self, items: Dict[tuple, tuple]):
+        """Store many cache entries ((bucket, field) -> (data, ttl)) in one pipeline"""
+        if not self.redis_client or not items:
+            return
+
+        try:
+            now = time.time()
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for (bucket, field), (data, ttl) in items.items():
+                    pipe.hset(bucket, field, data)
+                    pipe.zadd(self.CACHE_EXPIRE_ZSET, {f"{bucket}\x00{field}": now + ttl})
+                await pipe.execute()
+            logger.debug(f"Pipelined {len(items)} cache writes")
+        except Exception as e:
+            logger.warning(f"Cache pipeline error: {e}")
+
+    async def _sweep_expired_cache(self):
+        """Drop hash fields whose indexed expiry has passed (one pipeline)"""
+        if not self.redis_client:
+            return
+
+        try:
+            now = time.time()
+            expired = await self.redis_client.zrangebyscore(self.CACHE_EXPIRE_ZSET, 0, now)
+            if not expired:
+                return
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for member in expired:
+                    bucket, _, field = bytes(member).partition(b'\x00')
+                    pipe.hdel(bucket, field)
+                pipe.zremrangebyscore(self.CACHE_EXPIRE_ZSET, 0, now)
+                await pipe.execute()
+            logger.debug(f"Swept {len(expired)} expired cache entries")
+        except Exception as e:
+            logger.warning(f"Cache sweep error: {e}")
+
+    async def _sweep_loop(self):
+        """Background task standing in for the per-key TTLs hashes don't have"""
+        while True:
+            await asyncio.sleep(self.CACHE_SWEEP_INTERVAL)
+            await self._sweep_expired_cache()
+
+    async def invalidate_postal_code(self, code_postal: str):
+        """
+        Drop every cached entry for a postal code
+
+        One DEL per bucket - the point of hash-bucketed storage. Use after
+        an upstream refresh (e.g. the monthly DVF publication).
+        """
+        if not self.redis_client:
+            return
+
+        await self.redis_client.delete(
+            f"ecoimmo:dvf:{code_postal}",
+            f"ecoimmo:dvf:parsed:{code_postal}",
+            f"ecoimmo:dpe:{code_postal}",
+            f"ecoimmo:dpe:parsed:{code_postal}",
+        )
+        logger.info(f"Invalidated cache for postal code {code_postal}")
+
     async def _fetch_with_retry(
         self,
         url: str,
         params: Dict,
-        max_retries: int = MAX_RETRIES
+        max_retries: int = MAX_RETRIES,
+        sem: Optional[asyncio.Semaphore] = None,
+        limiter: Optional[AsyncLimiter] = None,
+        validators: Optional[Dict[str, str]] = None
     ) -> Optional[Dict]:
         """
         Fetch data with exponential backoff retry logic
@@ -203,24 +526,62 @@ class FrenchGovDataFetcher:
             url: API endpoint URL
             params: Query parameters
             max_retries: Maximum number of retry attempts
+            sem: Cap on in-flight requests for this endpoint
+            limiter: Token bucket enforcing the endpoint's requests/minute
+            validators: In/out dict of HTTP validators. Any 'etag' /
+                'last_modified' entries are sent as If-None-Match /
+                If-Modified-Since; on a 200 the dict is refreshed from the
+                response headers, on a 304 _NOT_MODIFIED is returned
 
         Returns:
-            JSON response or None if all retries failed
+            JSON response, _NOT_MODIFIED for a 304, or None if all retries
+            failed
         """
         if not self.session:
             raise RuntimeError("HTTP session not initialized. Call connect() first.")
 
+        gate = sem if sem is not None else nullcontext()
+        pacer = limiter if limiter is not None else nullcontext()
+
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
         for attempt in range(max_retries):
             try:
-                async with self.session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    logger.info(f"API call successful: {url}")
-                    return data
+                async with gate, pacer:
+                    async with self.session.get(
+                        url, params=params, headers=headers or None
+                    ) as response:
+                        if response.status == 304:
+                            logger.info(f"API data unchanged (304): {url}")
+                            return _NOT_MODIFIED
+                        response.raise_for_status()
+                        # orjson over response.json(): 3-10x faster decode,
+                        # and reading raw bytes skips aiohttp's charset dance;
+                        # large pages parse off the event loop
+                        data = await _parse_offloading(orjson.loads, await response.read())
+                        if validators is not None:
+                            validators.clear()
+                            if response.headers.get('ETag'):
+                                validators['etag'] = response.headers['ETag']
+                            if response.headers.get('Last-Modified'):
+                                validators['last_modified'] = response.headers['Last-Modified']
+                        logger.info(f"API call successful: {url}")
+                        return data
 
             except aiohttp.ClientError as e:
                 if attempt < max_retries - 1:
                     backoff = self.RETRY_BACKOFF_SECONDS[attempt]
+                    # On 429, honor the server's own pacing if it's longer
+                    # than our scheduled backoff
+                    if isinstance(e, aiohttp.ClientResponseError) and e.status == 429:
+                        retry_after = (e.headers or {}).get('Retry-After', '')
+                        if retry_after.isdigit():
+                            backoff = max(backoff, int(retry_after))
                     logger.warning(f"API call failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {backoff}s...")
                     await asyncio.sleep(backoff)
                 else:
@@ -229,6 +590,74 @@ class FrenchGovDataFetcher:
 
         return None
 
+    async def _fetch_paginated(
+        self,
+        url: str,
+        base_params: Dict,
+        total_limit: int,
+        page_size: int = 100,
+        sem: Optional[asyncio.Semaphore] = None,
+        limiter: Optional[AsyncLimiter] = None,
+        records_key: str = 'records',
+        validators: Optional[Dict[str, str]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch up to total_limit records as parallel fixed-size pages
+
+        The API caps single responses around 100 rows, so a large limit was
+        previously silently truncated. Offset pages are issued concurrently
+        with asyncio.gather; the per-endpoint semaphore and rate limiter
+        still pace the individual requests, so no extra inter-page sleeps
+        are needed.
+
+        Args:
+            url: API endpoint URL (offset-paginated)
+            base_params: Query parameters shared by every page
+            total_limit: Total number of records wanted
+            page_size: Rows per page (API maximum)
+            sem: Per-endpoint in-flight cap
+            limiter: Per-endpoint requests/minute bucket
+            records_key: Envelope key holding the row list
+            validators: HTTP validators for conditional fetching (see
+                _fetch_with_retry). Only honored for single-page fetches -
+                a validator describes one response, not a page set
+
+        Returns:
+            Flattened list of records across all pages (possibly empty),
+            _NOT_MODIFIED when a conditional single-page fetch came back
+            304, or None when any page failed after retries - a partial
+            page set is never returned, since callers would cache it as
+            if it were complete
+        """
+        single_page = total_limit <= page_size
+        tasks = []
+        for offset in range(0, total_limit, page_size):
+            params = dict(base_params)
+            params['limit'] = min(page_size, total_limit - offset)
+            params['offset'] = offset
+            tasks.append(self._fetch_with_retry(
+                url, params, sem=sem, limiter=limiter,
+                validators=validators if single_page else None
+            ))
+
+        responses = await asyncio.gather(*tasks)
+        if single_page and responses[0] is _NOT_MODIFIED:
+            return _NOT_MODIFIED
+
+        records: List[Dict] = []
+        for offset, response in zip(range(0, total_limit, page_size), responses):
+            if response is None:
+                logger.error(f"Page fetch failed after retries: {url} offset={offset}")
+                return None
+            if records_key not in response:
+                # A 200 without the records envelope is a malformed or
+                # contract-changed response, not an empty page - treat it
+                # as a failure so the caller doesn't cache it as complete
+                logger.error(f"Invalid API response (no '{records_key}'): {url} offset={offset}")
+                return None
+            records.extend(response[records_key])
+        return records
+
     def _anonymize_address(self, transaction: Dict) -> Dict:
         """
         Anonymize address data according to GDPR configuration
@@ -274,49 +703,89 @@ class FrenchGovDataFetcher:
         Returns:
             List of DVF transactions
         """
-        # Build query parameters
+        # Build query parameters from the precompiled filter table
         params = {"limit": limit}
-        where_clauses = []
-
-        if code_postal:
-            where_clauses.append(f"code_postal='{code_postal}'")
-        if code_commune:
-            where_clauses.append(f"code_commune='{code_commune}'")
-        if date_min:
-            where_clauses.append(f"date_mutation>='{date_min.strftime('%Y-%m-%d')}'")
-        if date_max:
-            where_clauses.append(f"date_mutation<='{date_max.strftime('%Y-%m-%d')}'")
-        if type_local:
-            where_clauses.append(f"type_local='{type_local}'")
-
-        if where_clauses:
-            params["where"] = " AND ".join(where_clauses)
-
-        # Check cache
-        cache_key = self._generate_cache_key("dvf", params)
-        cached_data = await self._get_from_cache(cache_key)
+        values = {
+            'code_postal': code_postal,
+            'code_commune': code_commune,
+            'date_min': date_min,
+            'date_max': date_max,
+            'type_local': type_local,
+        }
+        where = " AND ".join(fmt(values[name]) for name, fmt in _DVF_FILTERS if values[name])
+        if where:
+            params["where"] = where
+
+        # Check the parsed-model cache first: a hit skips JSON record
+        # iteration and per-model validation entirely
+        bucket, field = self._generate_cache_ref("dvf", code_postal, params)
+        parsed_bucket, parsed_field = self._generate_cache_ref(
+            "dvf:parsed", code_postal, self._parsed_cache_params(params)
+        )
 
-        if cached_data:
-            import json
-            records = json.loads(cached_data)
+        parsed_data = await self._get_from_cache(parsed_bucket, parsed_field)
+        if parsed_data:
+            transactions = await _parse_offloading(_DVF_LIST_DECODER.decode, parsed_data)
+            logger.info(f"Fetched {len(transactions)} DVF transactions (parsed cache)")
+            return transactions
+
+        # Fall back to the raw-records cache. A body past its freshness
+        # deadline is not discarded outright: DVF is republished monthly,
+        # so most refreshes can be answered by a bodyless 304
+        cached_data = await self._get_from_cache(bucket, field)
+        meta = await self._get_cache_meta(bucket, field) if cached_data else None
+        stale = bool(meta) and meta['fresh_until'] < time.time()
+
+        if cached_data and not stale:
+            records = await _parse_offloading(orjson.loads, cached_data)
         else:
-            # Fetch from API
-            response = await self._fetch_with_retry(self.DVF_BASE_URL, params)
-            if not response or 'records' not in response:
-                logger.error("Invalid DVF API response")
+            # Send stored validators on revalidation; on a first fetch the
+            # empty dict just captures the response's ETag/Last-Modified
+            validators = {
+                k: meta[k] for k in ('etag', 'last_modified') if meta and meta.get(k)
+            } if stale else {}
+
+            # Fetch from API, in parallel pages when limit exceeds one page
+            result = await self._fetch_paginated(
+                self.DVF_BASE_URL, params, limit,
+                sem=self._dvf_sem, limiter=self._dvf_limiter,
+                validators=validators
+            )
+            if result is _NOT_MODIFIED:
+                # Unchanged upstream: extend the cached body's freshness
+                # instead of re-downloading and re-storing it
+                await self._extend_cache_freshness(bucket, field, meta, self.CACHE_TTL_DVF)
+                records = await _parse_offloading(orjson.loads, cached_data)
+            elif result is None:
+                # At least one page failed after retries - don't cache a
+                # partial (or absent) result set as if it were complete
+                logger.error("DVF API request failed")
                 return []
+            else:
+                # Cache the results, including legitimately empty ones -
+                # refetching an empty postal code on every call would
+                # hammer the API for nothing (orjson.dumps returns bytes)
+                records = result
+                await self._set_to_cache(
+                    bucket, field,
+                    orjson.dumps(records),
+                    self.CACHE_TTL_DVF,
+                    meta=validators or None
+                )
 
-            records = response['records']
+        # Parse and anonymize, then cache the validated models for next time
+        transactions = self._parse_dvf_records(records, limit)
+        await self._set_to_cache(
+            parsed_bucket, parsed_field,
+            _STRUCT_ENCODER.encode(transactions),
+            self.CACHE_TTL_DVF
+        )
 
-            # Cache the results
-            import json
-            await self._set_to_cache(
-                cache_key,
-                json.dumps(records).encode(),
-                self.CACHE_TTL_DVF
-            )
+        logger.info(f"Fetched {len(transactions)} DVF transactions")
+        return transactions
 
-        # Parse and anonymize
+    def _parse_dvf_records(self, records: List[Dict], limit: int) -> List[DVFTransaction]:
+        """Parse and anonymize raw DVF records into validated transactions"""
         transactions = []
         for record in records[:limit]:
             fields = record.get('fields', {})
@@ -325,30 +794,120 @@ class FrenchGovDataFetcher:
             fields = self._anonymize_address(fields)
 
             try:
+                (id_mutation, date_mutation, nature_mutation, valeur_fonciere,
+                 adresse_numero, adresse_nom_voie, code_postal, code_commune,
+                 nom_commune, type_local, surface_reelle_bati,
+                 nombre_pieces_principales, longitude, latitude
+                 ) = _DVF_GETTER({**_DVF_DEFAULTS, **fields})
                 transaction = DVFTransaction(
-                    id_mutation=fields.get('id_mutation', ''),
-                    date_mutation=datetime.fromisoformat(fields.get('date_mutation', '').replace('Z', '+00:00')),
-                    nature_mutation=fields.get('nature_mutation', ''),
-                    valeur_fonciere=float(fields.get('valeur_fonciere', 0)),
-                    adresse_numero=fields.get('adresse_numero'),
-                    adresse_nom_voie=fields.get('adresse_nom_voie'),
-                    code_postal=fields.get('code_postal', ''),
-                    code_commune=fields.get('code_commune', ''),
-                    nom_commune=fields.get('nom_commune', ''),
-                    type_local=fields.get('type_local', ''),
-                    surface_reelle_bati=fields.get('surface_reelle_bati'),
-                    nombre_pieces_principales=fields.get('nombre_pieces_principales'),
-                    longitude=fields.get('longitude'),
-                    latitude=fields.get('latitude')
+                    id_mutation,
+                    # Python 3.11+ fromisoformat parses a trailing 'Z'
+                    # natively - no per-record str.replace needed
+                    datetime.fromisoformat(date_mutation),
+                    nature_mutation,
+                    float(valeur_fonciere),
+                    adresse_numero,
+                    adresse_nom_voie,
+                    code_postal,
+                    code_commune,
+                    nom_commune,
+                    type_local,
+                    surface_reelle_bati,
+                    nombre_pieces_principales,
+                    longitude,
+                    latitude
                 )
                 transactions.append(transaction)
             except Exception as e:
                 logger.warning(f"Failed to parse DVF record: {e}")
                 continue
 
-        logger.info(f"Fetched {len(transactions)} DVF transactions")
         return transactions
 
+    async def fetch_dvf_batch(
+        self,
+        postal_codes: List[str],
+        limit: int = 100
+    ) -> Dict[str, List[DVFTransaction]]:
+        """
+        Fetch DVF transactions for many postal codes in one pass
+
+        One MGET resolves every cached postal code in a single Redis
+        round-trip instead of N sequential GETs; only the misses hit the
+        API (concurrently, still paced by the DVF semaphore and rate
+        limiter) and their cache writes go out in one pipeline.
+
+        Args:
+            postal_codes: Postal codes to fetch (e.g., ["75001", "75002"])
+            limit: Maximum number of results per postal code
+
+        Returns:
+            Mapping of postal code to its transactions
+        """
+        params_by_code = {
+            code: {"limit": limit, "where": "code_postal=" + _quote_odsql(code)}
+            for code in postal_codes
+        }
+        cache_refs = {
+            code: self._generate_cache_ref("dvf", code, params)
+            for code, params in params_by_code.items()
+        }
+        parsed_refs = {
+            code: self._generate_cache_ref(
+                "dvf:parsed", code, self._parsed_cache_params(params)
+            )
+            for code, params in params_by_code.items()
+        }
+
+        # One pipelined read covers the parsed-model and raw-records entries
+        # for every code
+        cached = await self._mget_from_cache(
+            list(parsed_refs.values()) + list(cache_refs.values())
+        )
+
+        results: Dict[str, List[DVFTransaction]] = {}
+        to_cache: Dict[tuple, tuple] = {}
+        misses = []
+        for i, code in enumerate(postal_codes):
+            parsed_data, raw_data = cached[i], cached[len(postal_codes) + i]
+            if parsed_data:
+                results[code] = await _parse_offloading(_DVF_LIST_DECODER.decode, parsed_data)
+            elif raw_data:
+                transactions = self._parse_dvf_records(orjson.loads(raw_data), limit)
+                results[code] = transactions
+                to_cache[parsed_refs[code]] = (
+                    _STRUCT_ENCODER.encode(transactions), self.CACHE_TTL_DVF
+                )
+            else:
+                misses.append(code)
+
+        if misses:
+            async def fetch_one(code: str):
+                records = await self._fetch_paginated(
+                    self.DVF_BASE_URL, params_by_code[code], limit,
+                    sem=self._dvf_sem, limiter=self._dvf_limiter
+                )
+                return code, records
+
+            for code, records in await asyncio.gather(*(fetch_one(c) for c in misses)):
+                if records is None:
+                    # Failed fetch: return no transactions for this code
+                    # but never cache the failure
+                    logger.error(f"DVF API request failed for postal code {code}")
+                    results[code] = []
+                    continue
+                transactions = self._parse_dvf_records(records, limit)
+                results[code] = transactions
+                to_cache[cache_refs[code]] = (orjson.dumps(records), self.CACHE_TTL_DVF)
+                to_cache[parsed_refs[code]] = (
+                    _STRUCT_ENCODER.encode(transactions), self.CACHE_TTL_DVF
+                )
+
+        await self._mset_to_cache(to_cache)
+
+        logger.info(f"Batch DVF fetch: {len(postal_codes)} postal codes, {len(misses)} API calls")
+        return results
+
     async def fetch_dpe_diagnostics(
         self,
         code_postal: Optional[str] = None,
@@ -372,41 +931,48 @@ class FrenchGovDataFetcher:
         """
         # Build query parameters
         params = {"size": limit}
-        query_parts = []
-
-        if code_postal:
-            query_parts.append(f"Code_postal_(BAN):{code_postal}")
-        if classe_consommation:
-            query_parts.append(f"Classe_consommation_énergie:{classe_consommation}")
-        if type_batiment:
-            query_parts.append(f"Type_bâtiment:{type_batiment}")
-        if date_min:
-            query_parts.append(f"Date_établissement_DPE:>={date_min.strftime('%Y-%m-%d')}")
-
-        if query_parts:
-            params["q"] = " AND ".join(query_parts)
-
-        # Check cache
-        cache_key = self._generate_cache_key("dpe", params)
-        cached_data = await self._get_from_cache(cache_key)
+        values = {
+            'code_postal': code_postal,
+            'classe_consommation': classe_consommation,
+            'type_batiment': type_batiment,
+            'date_min': date_min,
+        }
+        query = " AND ".join(fmt(values[name]) for name, fmt in _DPE_FILTERS if values[name])
+        if query:
+            params["q"] = query
+
+        # Check the parsed-model cache first (see fetch_dvf_transactions)
+        bucket, field = self._generate_cache_ref("dpe", code_postal, params)
+        parsed_bucket, _ = self._generate_cache_ref("dpe:parsed", code_postal, params)
+
+        parsed_data = await self._get_from_cache(parsed_bucket, field)
+        if parsed_data:
+            diagnostics = await _parse_offloading(_DPE_LIST_DECODER.decode, parsed_data)
+            logger.info(f"Fetched {len(diagnostics)} DPE diagnostics (parsed cache)")
+            return diagnostics
+
+        # Fall back to the raw-results cache
+        cached_data = await self._get_from_cache(bucket, field)
 
         if cached_data:
-            import json
-            results = json.loads(cached_data)
+            results = await _parse_offloading(orjson.loads, cached_data)
         else:
             # Fetch from API
-            response = await self._fetch_with_retry(self.ADEME_DPE_BASE_URL, params)
+            response = await self._fetch_with_retry(
+                self.ADEME_DPE_BASE_URL, params,
+                sem=self._dpe_sem, limiter=self._dpe_limiter
+            )
             if not response or 'results' not in response:
                 logger.error("Invalid ADEME DPE API response")
                 return []
 
             results = response['results']
 
-            # Cache the results
-            import json
+            # Cache the results (orjson.dumps already returns bytes)
             await self._set_to_cache(
-                cache_key,
-                json.dumps(results).encode(),
+                bucket,
+                field,
+                orjson.dumps(results),
                 self.CACHE_TTL_DPE
             )
 
@@ -414,31 +980,47 @@ class FrenchGovDataFetcher:
         diagnostics = []
         for result in results[:limit]:
             try:
+                (n_dpe, date_etablissement_dpe, classe_consommation_energie,
+                 classe_estimation_ges, consommation_energie, estimation_ges,
+                 code_postal_ban, type_batiment, annee_construction,
+                 surface_habitable, type_energie_principale_chauffage,
+                 type_installation_chauffage, type_energie_n_1,
+                 conso_chauffage, conso_ecs, conso_refroidissement,
+                 conso_eclairage, conso_auxiliaires
+                 ) = _DPE_GETTER({**_DPE_DEFAULTS, **result})
                 diagnostic = DPEDiagnostic(
-                    n_dpe=result.get('N°DPE', ''),
-                    date_etablissement_dpe=datetime.fromisoformat(result.get('Date_établissement_DPE', '').replace('Z', '+00:00')),
-                    classe_consommation_energie=result.get('Classe_consommation_énergie', ''),
-                    classe_estimation_ges=result.get('Classe_estimation_GES', ''),
-                    consommation_energie=float(result.get('Consommation_énergie', 0)),
-                    estimation_ges=float(result.get('Estimation_GES', 0)),
-                    code_postal=result.get('Code_postal_(BAN)', ''),
-                    type_batiment=result.get('Type_bâtiment', ''),
-                    annee_construction=result.get('Année_construction'),
-                    surface_habitable=float(result.get('Surface_habitable_logement', 0)),
-                    type_energie_principale_chauffage=result.get('Type_énergie_principale_chauffage', ''),
-                    type_installation_chauffage=result.get('Type_installation_chauffage'),
-                    type_energie_n_1=result.get('Type_énergie_n°1'),
-                    conso_chauffage=result.get('Conso_chauffage_é_finale'),
-                    conso_ecs=result.get('Conso_ECS_é_finale'),
-                    conso_refroidissement=result.get('Conso_refroidissement_é_finale'),
-                    conso_eclairage=result.get('Conso_éclairage_é_finale'),
-                    conso_auxiliaires=result.get('Conso_auxiliaires_é_finale')
+                    n_dpe,
+                    datetime.fromisoformat(date_etablissement_dpe),
+                    classe_consommation_energie,
+                    classe_estimation_ges,
+                    float(consommation_energie),
+                    float(estimation_ges),
+                    code_postal_ban,
+                    type_batiment,
+                    annee_construction,
+                    float(surface_habitable),
+                    type_energie_principale_chauffage,
+                    type_installation_chauffage,
+                    type_energie_n_1,
+                    conso_chauffage,
+                    conso_ecs,
+                    conso_refroidissement,
+                    conso_eclairage,
+                    conso_auxiliaires
                 )
                 diagnostics.append(diagnostic)
             except Exception as e:
                 logger.warning(f"Failed to parse DPE record: {e}")
                 continue
 
+        # Cache the validated models for next time
+        await self._set_to_cache(
+            parsed_bucket,
+            field,
+            _STRUCT_ENCODER.encode(diagnostics),
+            self.CACHE_TTL_DPE
+        )
+
         logger.info(f"Fetched {len(diagnostics)} DPE diagnostics")
         return diagnostics
 
@@ -474,37 +1056,71 @@ class FrenchGovDataFetcher:
 
         transactions, diagnostics = await asyncio.gather(dvf_task, dpe_task)
 
-        # Create DPE lookup by postal code + approximate surface
-        dpe_map = {}
-        for dpe in diagnostics:
-            key = f"{dpe.code_postal}_{int(dpe.surface_habitable / 10) * 10}"  # Round to nearest 10m²
-            if key not in dpe_map:
-                dpe_map[key] = []
-            dpe_map[key].append(dpe)
+        if not transactions:
+            return []
+
+        # Columnar join on (postal code, 10m² surface bucket) instead of
+        # per-record f-string keys and dict grouping: binning, deduplication
+        # and matching all run vectorized in C, and only the join keys plus
+        # positional indices into the model lists ever enter the frames
+        dvf_df = pd.DataFrame({
+            'txn_idx': range(len(transactions)),
+            'code_postal': [t.code_postal for t in transactions],
+            'surface': [t.surface_reelle_bati for t in transactions],
+        })
+        dvf_df = dvf_df[dvf_df['surface'].notna() & (dvf_df['surface'] > 0)]
+        dvf_df['surface_bin'] = (dvf_df['surface'] // 10 * 10).astype(int)  # Round to nearest 10m²
+
+        if diagnostics:
+            # Bin the DPE surfaces vectorized too: one ufunc pass over a
+            # float array instead of int()/divide bytecode per diagnostic
+            dpe_surfaces = np.fromiter(
+                (d.surface_habitable for d in diagnostics),
+                dtype=np.float64, count=len(diagnostics)
+            )
+            dpe_df = pd.DataFrame({
+                'dpe_idx': range(len(diagnostics)),
+                'code_postal': [d.code_postal for d in diagnostics],
+                'date': [d.date_etablissement_dpe for d in diagnostics],
+                'surface_bin': (dpe_surfaces // 10).astype(np.int64) * 10,
+            })
+
+            # Keep the most recent DPE per bucket, then one left hash join
+            latest_dpe = (
+                dpe_df.sort_values('date')
+                .drop_duplicates(['code_postal', 'surface_bin'], keep='last')
+            )
+            merged = dvf_df.merge(
+                latest_dpe[['code_postal', 'surface_bin', 'dpe_idx']],
+                on=['code_postal', 'surface_bin'],
+                how='left'
+            )
+        else:
+            merged = dvf_df.assign(dpe_idx=None)
 
-        # Enrich transactions with DPE data
+        # Emit dicts only at the end, from the matched model objects. The
+        # same diagnostic matches many transactions, so its dict is built
+        # once and the reference shared across rows; each transaction
+        # appears in at most one row, so its dict is already one-shot
+        dpe_dict_cache: Dict[int, Dict[str, Any]] = {}
         enriched = []
-        for txn in transactions:
-            if not txn.surface_reelle_bati:
-                continue
-
-            # Try to find matching DPE
-            surface_key = f"{txn.code_postal}_{int(txn.surface_reelle_bati / 10) * 10}"
-            matching_dpes = dpe_map.get(surface_key, [])
-
-            if matching_dpes:
-                # Take the most recent DPE
-                most_recent_dpe = max(matching_dpes, key=lambda d: d.date_etablissement_dpe)
-
+        for txn_idx, dpe_idx in zip(merged['txn_idx'], merged['dpe_idx']):
+            if pd.notna(dpe_idx):
+                dpe_idx = int(dpe_idx)
+                dpe_dict = dpe_dict_cache.get(dpe_idx)
+                if dpe_dict is None:
+                    dpe_dict = dpe_dict_cache[dpe_idx] = msgspec.structs.asdict(
+                        diagnostics[dpe_idx]
+                    )
                 enriched.append({
-                    'transaction': txn.dict(),
-                    'dpe': most_recent_dpe.dict(),
+                    'transaction': msgspec.structs.asdict(transactions[txn_idx]),
+                    'dpe': dpe_dict,
                     'confidence': 'medium'  # Surface-based matching
                 })
             else:
                 # No DPE found
                 enriched.append({
-                    'transaction': txn.dict(),
+                    'transaction': msgspec.structs.asdict(transactions[txn_idx]),
                     'dpe': None,
                     'confidence': 'none'
                 })